@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from config import *
+
+import gc
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+
+sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, ROOT)
+
+
+def get_current_version():
+    import toml
+    data = toml.load(PYPROJECT_TOML)
+    return data["project"]["version"]
+
+
+def get_rss():
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+def widget_factories():
+    from zbWidgetLib import (BigInfoCard, SmallInfoCard, IntroductionCard, DisplayCard, CardGroup, FlowCardGroup, GrayCard,
+                             PageSpliter, StatisticsWidget, LoadingCard, LoadingMessageBox, CustomProgressRing,
+                             PartialProgressRing, CustomProgressBar, BasicPage, BasicTabPage)
+    from qtpy.QtWidgets import QWidget
+
+    # 遮罩对话框需要父组件提供尺寸
+    host = QWidget()
+    host.resize(800, 600)
+
+    def big_info_card():
+        card = BigInfoCard()
+        card.setTitle("标题")
+        card.setInfo("信息" * 20)
+        card.addUrl("链接", "https://example.com")
+        card.addData("数据", 1)
+        card.addTag("标签")
+        return card
+
+    def small_info_card():
+        card = SmallInfoCard()
+        card.setTitle("标题")
+        for i in range(4):
+            card.setText(f"文本{i}", i)
+        return card
+
+    return {
+        "BigInfoCard": big_info_card,
+        "SmallInfoCard": small_info_card,
+        "IntroductionCard": IntroductionCard,
+        "DisplayCard": DisplayCard,
+        "CardGroup": CardGroup,
+        "FlowCardGroup": FlowCardGroup,
+        "GrayCard": GrayCard,
+        "StatisticsWidget": lambda: StatisticsWidget("标题", "值"),
+        "PageSpliter": lambda: PageSpliter(total_count=1000),
+        "LoadingCard": LoadingCard,
+        "LoadingMessageBox": lambda: LoadingMessageBox(host),
+        "CustomProgressRing": lambda: CustomProgressRing(indeterminate=True),
+        "PartialProgressRing": lambda: PartialProgressRing(indeterminate=True),
+        "CustomProgressBar": lambda: CustomProgressBar(indeterminate=True),
+        "BasicPage": lambda: BasicPage(title="标题", subtitle="副标题"),
+        "BasicTabPage": BasicTabPage,
+    }
+
+
+def dispose(app, widgets: list):
+    for widget in widgets:
+        widget.deleteLater()
+    widgets.clear()
+    app.processEvents()
+    app.sendPostedEvents(None, 0)
+    gc.collect()
+
+
+def measure_construction(app, factory, count: int):
+    widgets = []
+    start = time.perf_counter()
+    for _ in range(count):
+        widgets.append(factory())
+    elapsed = time.perf_counter() - start
+    dispose(app, widgets)
+    return elapsed / count
+
+
+def measure_paint(app, factory, frames: int):
+    from qtpy.QtGui import QPixmap
+    from qtpy.QtCore import Qt, QSize
+
+    widget = factory()
+    widget.resize(widget.sizeHint().expandedTo(widget.minimumSize()).expandedTo(QSize(16, 16)))
+    pixmap = QPixmap(widget.width(), widget.height())
+    pixmap.fill(Qt.transparent)
+    widget.render(pixmap)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        widget.render(pixmap)
+    elapsed = time.perf_counter() - start
+    dispose(app, [widget])
+    return elapsed / frames
+
+
+def measure_memory(app, factory, count: int):
+    gc.collect()
+    rss_before = get_rss()
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    widgets = [factory() for _ in range(count)]
+    app.processEvents()
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    rss_after = get_rss()
+
+    python_bytes = sum(i.size_diff for i in snapshot_after.compare_to(snapshot_before, "filename"))
+    dispose(app, widgets)
+    return {
+        "python": python_bytes / count,
+        "rss": (rss_after - rss_before) / count if rss_before is not None else None,
+    }
+
+
+def measure_progress_frames(app, frames: int):
+    """
+    逐帧推进不确定动画相位并绘制，测量进度组件每帧的绘制耗时，与改动前的结果对比即可得到优化效果
+    """
+    from qtpy.QtGui import QImage
+    from qtpy.QtCore import Qt
+    from zbWidgetLib import CustomProgressRing, PartialProgressRing, CustomProgressBar
+
+    cases = {
+        "CustomProgressRing": lambda: CustomProgressRing(indeterminate=True),
+        "PartialProgressRing": lambda: PartialProgressRing(indeterminate=True, maxAngle=270),
+        "CustomProgressBar": lambda: CustomProgressBar(indeterminate=True),
+    }
+    if hasattr(CustomProgressRing, "setUseSprite"):
+        def sprite_ring():
+            ring = CustomProgressRing(indeterminate=True)
+            ring.setUseSprite(True)
+            return ring
+
+        cases["CustomProgressRing(sprite)"] = sprite_ring
+    out = {}
+    for name, factory in cases.items():
+        widget = factory()
+        if isinstance(widget, CustomProgressBar):
+            widget.resize(300, widget.height())
+        image = QImage(widget.width(), widget.height(), QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        widget.render(image)
+
+        start = time.perf_counter()
+        for i in range(frames):
+            if hasattr(widget, "_setIndeterminatePhase"):
+                widget._aniElapsed = i * 16
+                widget._setIndeterminatePhase(i * 16)
+            widget.render(image)
+        elapsed = time.perf_counter() - start
+        dispose(app, [widget])
+        out[name] = elapsed / frames
+    return out
+
+
+def run(count: int = 50, frames: int = 200, import_repeat: int = 5, include_import: bool = True):
+    out = {
+        "version": get_current_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+    if include_import:
+        from benchmark_import import run as run_import
+        out["import"] = run_import(import_repeat)
+
+    from qtpy.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    widgets = {}
+    for name, factory in widget_factories().items():
+        dispose(app, [factory()])
+        widgets[name] = {
+            "construct": measure_construction(app, factory, count),
+            "paint": measure_paint(app, factory, frames),
+            "memory": measure_memory(app, factory, count),
+        }
+    out["widgets"] = widgets
+    out["progress"] = measure_progress_frames(app, frames)
+    return out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-c", "--count", type=int, default=50, help="每个组件构造和内存测试的实例数量")
+    parser.add_argument("-f", "--frames", type=int, default=200, help="每个组件绘制测试的帧数")
+    parser.add_argument("-n", "--import-repeat", type=int, default=5, help="导入冷启动测试的重复次数")
+    parser.add_argument("--no-import", action="store_true", help="跳过导入时间测试")
+    parser.add_argument("-o", "--output", required=False, help="JSON结果保存路径")
+    args = parser.parse_args()
+
+    out = run(args.count, args.frames, args.import_repeat, not args.no_import)
+
+    for name, data in out.get("import", {}).items():
+        print(f"{name}: {data['median'] * 1000:.2f}ms")
+    for name, data in out["widgets"].items():
+        rss = data["memory"]["rss"]
+        rss = f"{rss / 1024:.1f}KB" if rss is not None else "-"
+        print(f"{name}: 构造{data['construct'] * 1000:.3f}ms 绘制{data['paint'] * 1000:.3f}ms/帧 "
+              f"Python内存{data['memory']['python'] / 1024:.1f}KB RSS{rss}")
+    for name, data in out["progress"].items():
+        print(f"{name}: 不确定动画{data * 1000:.3f}ms/帧")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(json.dumps(out, ensure_ascii=False, indent=4))
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from config import *
+
+import json
+import argparse
+import statistics
+import subprocess
+
+sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+
+CASES = {
+    "import zbWidgetLib": "import zbWidgetLib",
+    "from zbWidgetLib import CardGroup": "from zbWidgetLib import CardGroup",
+    "from zbWidgetLib import PageSpliter": "from zbWidgetLib import PageSpliter",
+    "from zbWidgetLib import *": "from zbWidgetLib import *",
+}
+
+CODE = """
+import sys, time, json
+start = time.perf_counter()
+{statement}
+end = time.perf_counter()
+print(json.dumps({{"time": end - start, "modules": len(sys.modules), "zbWidgetLib": sorted(i for i in sys.modules if i.startswith("zbWidgetLib."))}}))
+"""
+
+
+def measure(statement: str, repeat: int):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    times = []
+    result = {}
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", CODE.format(statement=statement)], cwd=ROOT, env=env, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        times.append(result["time"])
+    return {
+        "median": statistics.median(times),
+        "min": min(times),
+        "max": max(times),
+        "modules": result["modules"],
+        "zbWidgetLib_modules": result["zbWidgetLib"],
+    }
+
+
+def run(repeat: int = 5):
+    return {name: measure(statement, repeat) for name, statement in CASES.items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="每项冷启动测试的重复次数")
+    parser.add_argument("-o", "--output", required=False, help="JSON结果保存路径")
+    args = parser.parse_args()
+
+    out = run(args.repeat)
+    for name, data in out.items():
+        print(f"{name}: {data['median'] * 1000:.1f}ms（{len(data['zbWidgetLib_modules'])}个zbWidgetLib模块，共{data['modules']}个模块）")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(json.dumps(out, ensure_ascii=False, indent=4))
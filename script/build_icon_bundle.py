@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from config import *
+
+import argparse
+
+sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+
+sys.path.insert(0, ROOT)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", help="图标文件夹路径")
+    parser.add_argument("-o", "--output", required=False, help="图标包保存路径，默认为文件夹同名的.zbfb文件")
+    args = parser.parse_args()
+
+    from zbWidgetLib import IconBundle
+
+    output = args.output or os.path.abspath(args.path).rstrip("\\/") + ".zbfb"
+    IconBundle.build(args.path, output)
+
+    bundle = IconBundle(output)
+    print(f"已生成图标包：{output}，共{len(bundle.names())}个图标！")
+    bundle.close()
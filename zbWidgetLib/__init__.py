@@ -1 +1,22 @@
-from .components import *
\ No newline at end of file
+import importlib
+import importlib.util
+
+# base中的hook会修改Qt组件的方法，需要在导入包时立即生效
+from . import base
+
+
+def __getattr__(name: str):
+    """
+    按需从components中获取组件，仅导入用到的模块；子模块名直接导入对应子模块
+    """
+    if name.startswith("_") and name != "__all__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        return importlib.import_module(f".{name}", __name__)
+    value = getattr(importlib.import_module(".components", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return dir(importlib.import_module(".components", __name__))
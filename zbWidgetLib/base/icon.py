@@ -1,9 +1,276 @@
 from .hook import *
 
+import json
+import math
+import mmap
+import struct
+from collections import OrderedDict
+
 from aenum import Enum, extend_enum
+from qtpy.QtSvg import QSvgRenderer
+from qtpy.QtXml import QDomDocument
+
+
+class IconBundle:
+    MAGIC = b"ZBFB"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHHI")
+
+    def __init__(self, path: str):
+        """
+        图标包，单个文件内包含索引和拼接的SVG数据，以内存映射方式读取
+        文件格式：头部（魔数、版本、保留位、索引长度），JSON索引（名称: [偏移, 长度]），SVG数据
+        :param path: 图标包路径
+        """
+        self.path = os.path.abspath(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, _, index_length = self.HEADER.unpack_from(self._mmap, 0)
+            if magic != self.MAGIC or version != self.VERSION:
+                raise ValueError(f"{self.path}不是有效的图标包文件!")
+            start = self.HEADER.size
+            self._index = json.loads(self._mmap[start:start + index_length].decode("utf-8"))
+            self._dataStart = start + index_length
+        except Exception:
+            self._file.close()
+            raise
+
+    def names(self):
+        """
+        获取图标包内的图标名称
+        :return: 名称列表
+        """
+        return list(self._index.keys())
+
+    def data(self, name: str):
+        """
+        获取图标数据，返回内存映射的切片而非复制
+        :param name: 图标名称
+        :return: memoryview
+        """
+        offset, length = self._index[name]
+        start = self._dataStart + offset
+        return memoryview(self._mmap)[start:start + length]
+
+    def __contains__(self, name: str):
+        return name in self._index
+
+    def close(self):
+        """
+        关闭图标包
+        """
+        self._mmap.close()
+        self._file.close()
+
+    @classmethod
+    def build(cls, path: str, bundle_path: str):
+        """
+        将文件夹中的SVG图标打包为图标包，会将去除后缀名的文件名称作为图标名称
+        :param path: 文件夹路径
+        :param bundle_path: 图标包保存路径
+        :return: 图标包路径
+        """
+        index = {}
+        chunks = []
+        offset = 0
+        for root, _, files in os.walk(path):
+            for file in sorted(files):
+                name, suffix = os.path.splitext(file)
+                if suffix.lower() != ".svg" or name in index:
+                    continue
+                with open(os.path.join(root, file), "rb") as f:
+                    data = f.read()
+                index[name] = [offset, len(data)]
+                chunks.append(data)
+                offset += len(data)
+        index_data = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if os.path.dirname(bundle_path):
+            os.makedirs(os.path.dirname(bundle_path), exist_ok=True)
+        with open(bundle_path, "wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, 0, len(index_data)))
+            f.write(index_data)
+            for data in chunks:
+                f.write(data)
+        return bundle_path
+
+
+_bundles = {}
+_bundleIcons = {}
+
+
+class _ZBFRenderCache:
+    MAX_COUNT = 1024
+
+    def __init__(self):
+        """
+        ZBF图标渲染缓存，缓存SVG文件内容和按颜色、尺寸、设备像素比栅格化后的图片
+        """
+        self._svgData = {}
+        self._pixmaps = OrderedDict()
+
+    def svgData(self, path: str):
+        if path in _bundleIcons:
+            bundle, name = _bundleIcons[path]
+            return bundle.data(name)
+        data = self._svgData.get(path)
+        if data is None:
+            with open(path, "rb") as file:
+                data = file.read()
+            self._svgData[path] = data
+        return data
+
+    def pixmap(self, key):
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def insert(self, key, pixmap: QPixmap):
+        self._pixmaps[key] = pixmap
+        while len(self._pixmaps) > self.MAX_COUNT:
+            self._pixmaps.popitem(last=False)
+
+    def clear(self, *args):
+        self._pixmaps.clear()
+
+    def clearAll(self):
+        self._svgData.clear()
+        self._pixmaps.clear()
+
+
+_renderCache = _ZBFRenderCache()
+qconfig.themeChanged.connect(_renderCache.clear)
+qconfig.themeColorChanged.connect(_renderCache.clear)
+
+
+def _writeSvgData(data: bytes, indexes=None, **attributes):
+    """
+    修改SVG中path节点的属性，图标包的memoryview数据在解析时会复制一次，仅在渲染缓存未命中时发生
+    """
+    dom = QDomDocument()
+    dom.setContent(QByteArray(bytes(data)))
+    pathNodes = dom.elementsByTagName("path")
+    indexes = range(pathNodes.length()) if not indexes else indexes
+    for i in indexes:
+        element = pathNodes.at(i).toElement()
+        for attr, value in attributes.items():
+            element.setAttribute(attr, value)
+    return dom.toString().encode()
+
+
+def _devicePixelRatio(painter: QPainter):
+    device = painter.device()
+    if device is None:
+        return 1.0
+    try:
+        return device.devicePixelRatioF()
+    except AttributeError:
+        return float(device.devicePixelRatio())
+
+
+def _drawSvg(painter: QPainter, rect, icon: str, indexes, attributes: dict):
+    rect = QRectF(rect)
+    ratio = _devicePixelRatio(painter)
+    size = QSize(math.ceil(rect.width() * ratio), math.ceil(rect.height() * ratio))
+    if size.isEmpty():
+        return
+    key = (icon, tuple(indexes) if indexes else None, tuple(sorted(attributes.items())), size.width(), size.height(), ratio)
+    pixmap = _renderCache.pixmap(key)
+    if pixmap is None:
+        pixmap = QPixmap(size)
+        pixmap.fill(Qt.transparent)
+        svg_painter = QPainter(pixmap)
+        svg_painter.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
+        QSvgRenderer(QByteArray(_writeSvgData(_renderCache.svgData(icon), indexes, **attributes))).render(svg_painter, QRectF(0, 0, size.width(), size.height()))
+        svg_painter.end()
+        pixmap.setDevicePixelRatio(ratio)
+        _renderCache.insert(key, pixmap)
+    painter.drawPixmap(rect, pixmap, QRectF(pixmap.rect()))
+
+
+class _ZBFIconEngine(QIconEngine):
+
+    def __init__(self, icon, theme=Theme.AUTO, color: str = None):
+        """
+        通过ZBF.render绘制的图标引擎，用于没有真实文件路径的图标包图标
+        """
+        super().__init__()
+        self._icon = icon
+        self._theme = theme
+        self._color = color
+
+    def paint(self, painter: QPainter, rect: QRect, mode, state):
+        painter.save()
+        if mode == QIcon.Disabled:
+            painter.setOpacity(0.5)
+        elif mode == QIcon.Selected:
+            painter.setOpacity(0.7)
+        if self._color:
+            _drawSvg(painter, rect, self._icon.path(self._theme), None, {"fill": self._color})
+        else:
+            self._icon.render(painter, rect, self._theme)
+        painter.restore()
+
+    def pixmap(self, size: QSize, mode, state):
+        image = QImage(size, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        self.paint(painter, QRect(QPoint(0, 0), size), mode, state)
+        painter.end()
+        return QPixmap.fromImage(image)
 
+    def clone(self):
+        return _ZBFIconEngine(self._icon, self._theme, self._color)
 
-class ZBF(FluentIconBase, Enum):
+
+_lazyIcons = {}
+
+
+class _ZBFType(type(Enum)):
+    """
+    ZBF元类，延迟注册的图标在首次访问时才创建枚举成员
+    """
+
+    def _materialize(cls, name: str = None):
+        if name is None:
+            items = list(_lazyIcons.items())
+            _lazyIcons.clear()
+        elif name in _lazyIcons:
+            items = [(name, _lazyIcons.pop(name))]
+        else:
+            return
+        for item_name, data in items:
+            if item_name not in cls._member_map_:
+                extend_enum(cls, item_name, data)
+
+    def __getattr__(cls, name):
+        if name in _lazyIcons and not (name.startswith("__") and name.endswith("__")):
+            cls._materialize(name)
+            return cls._member_map_[name]
+        parent = getattr(super(), "__getattr__", None)
+        if parent is None:
+            raise AttributeError(name)
+        return parent(name)
+
+    def __getitem__(cls, name):
+        cls._materialize(name)
+        return super().__getitem__(name)
+
+    def __iter__(cls):
+        cls._materialize()
+        return super().__iter__()
+
+    def __reversed__(cls):
+        cls._materialize()
+        return super().__reversed__()
+
+    def __len__(cls):
+        cls._materialize()
+        return super().__len__()
+
+
+class ZBF(FluentIconBase, Enum, metaclass=_ZBFType):
 
     def __init__(self, *args):
         self.use_theme_color = False
@@ -11,12 +278,19 @@ class ZBF(FluentIconBase, Enum):
         self.dark_color = QColor(255, 255, 255)
 
     def path(self, theme=Theme.AUTO):
+        if self.value in _bundleIcons:
+            return self.value
         if hasattr(self, "default_path"):
             path = self.default_path
         else:
             path = ""
         return zb.joinPath(path, self.value)
 
+    def icon(self, theme=Theme.AUTO, color: QColor = None):
+        if self.value not in _bundleIcons:
+            return super().icon(theme, color)
+        return QIcon(_ZBFIconEngine(self, theme, QColor(color).name() if color else None))
+
     @classmethod
     def setPath(cls, path: str):
         """
@@ -46,17 +320,110 @@ class ZBF(FluentIconBase, Enum):
             extend_enum(cls, name, data)
 
     @classmethod
-    def addFromPath(cls, path: str):
+    def addLazy(cls, name: str, data: str = None):
+        """
+        延迟添加图片，仅记录名称，首次访问时才创建图标
+        :param name: 调用时的名称
+        :param data: 图片路径，不填默认使用name值，需要后缀名
+        """
+        if not data:
+            data = name
+        if name not in _lazyIcons and name not in cls._member_map_:
+            _lazyIcons[name] = data
+
+    @classmethod
+    def addFromPath(cls, path: str, lazy: bool = False):
         """
         从指定路径批量导入图标，会将去除后缀名的文件名称作为图标名称
         :param path: 文件夹路径
+        :param lazy: 是否延迟导入，仅索引文件名称，首次访问图标时才创建
+        """
+        if not lazy:
+            for i in zb.walkFile(path, True):
+                ZBF.add(zb.getFileName(i, False), os.path.abspath(i))
+            return
+        for root, _, files in os.walk(path):
+            for file in files:
+                cls.addLazy(os.path.splitext(file)[0], os.path.abspath(os.path.join(root, file)))
+
+    @classmethod
+    def buildManifest(cls, path: str, manifest_path: str = None):
+        """
+        为图标文件夹生成清单文件，清单记录图标名称和相对路径，用于快速延迟导入
+        :param path: 文件夹路径
+        :param manifest_path: 清单文件路径，不填默认为文件夹下的manifest.json
+        :return: 清单文件路径
+        """
+        if not manifest_path:
+            manifest_path = os.path.join(path, "manifest.json")
+        base = os.path.dirname(os.path.abspath(manifest_path))
+        icons = {}
+        for root, _, files in os.walk(path):
+            for file in sorted(files):
+                file_path = os.path.abspath(os.path.join(root, file))
+                if file_path == os.path.abspath(manifest_path):
+                    continue
+                icons.setdefault(os.path.splitext(file)[0], os.path.relpath(file_path, base).replace(os.sep, "/"))
+        with open(manifest_path, "w", encoding="utf-8") as file:
+            json.dump(icons, file, ensure_ascii=False, indent=4)
+        return manifest_path
+
+    @classmethod
+    def addFromManifest(cls, manifest_path: str):
+        """
+        从清单文件延迟导入图标，无需遍历文件夹
+        :param manifest_path: 清单文件路径
+        """
+        base = os.path.dirname(os.path.abspath(manifest_path))
+        with open(manifest_path, "r", encoding="utf-8") as file:
+            icons = json.load(file)
+        for name, data in icons.items():
+            cls.addLazy(name, os.path.join(base, data))
+
+    @classmethod
+    def buildBundle(cls, path: str, bundle_path: str):
+        """
+        将文件夹中的SVG图标打包为单个图标包文件
+        :param path: 文件夹路径
+        :param bundle_path: 图标包保存路径
+        :return: 图标包路径
+        """
+        return IconBundle.build(path, bundle_path)
+
+    @classmethod
+    def addFromBundle(cls, bundle_path: str):
+        """
+        从图标包延迟导入图标，图标数据直接从内存映射的图标包中读取
+        图标包中的图标没有真实文件路径，需通过render或icon使用，不能直接将path传给QIcon
+        :param bundle_path: 图标包路径
+        """
+        bundle_path = os.path.abspath(bundle_path)
+        bundle = _bundles.get(bundle_path)
+        if bundle is None:
+            bundle = IconBundle(bundle_path)
+            _bundles[bundle_path] = bundle
+        for name in bundle.names():
+            data = os.path.join(bundle_path, name + ".svg")
+            _bundleIcons[data] = (bundle, name)
+            cls.addLazy(name, data)
+
+    @classmethod
+    def loadAll(cls):
         """
-        for i in zb.walkFile(path, True):
-            ZBF.add(zb.getFileName(i, False), os.path.abspath(i))
+        立即创建所有延迟导入的图标
+        """
+        cls._materialize()
+
+    @classmethod
+    def clearCache(cls):
+        """
+        清空图标渲染缓存，图标文件内容被修改后需要调用
+        """
+        _renderCache.clearAll()
 
     @classmethod
     def addInternalPath(cls):
-        cls.addFromPath(zb.joinPath(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "icons"))
+        cls.addFromPath(zb.joinPath(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "icons"), True)
 
     def useThemeColor(self, use_theme_color: bool = True):
         """
@@ -149,8 +516,8 @@ class ZBF(FluentIconBase, Enum):
                 color = self.dark_color if theme == Theme.DARK else self.light_color
         if color:
             attributes.update(fill=color.name())
-        icon = writeSvg(icon, indexes, **attributes).encode()
-        drawSvgIcon(icon, painter, rect)
+
+        _drawSvg(painter, rect, icon, indexes, attributes)
 
 
 ZBF.addInternalPath()
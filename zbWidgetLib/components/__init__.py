@@ -1,13 +1,64 @@
-from .button import *
-from .card import *
-from .file_chooser import *
-from .image import *
-from .loading import *
-from .page import *
-from .scroll import *
-from .widget import *
-from .window import *
-from .flyout import *
-from .info_badge import *
-from .splash_screen import *
-from .progress import *
\ No newline at end of file
+import importlib
+import importlib.util
+from types import ModuleType
+
+_MODULES = {
+    "button": ["CopyTextButton", "SaveFileBase", "SaveFilePushButton", "SaveFilePrimaryPushButton", "OpenFileBase", "OpenFilePushButton", "OpenFilePrimaryPushButton"],
+    "card": ["DisplayCard", "IntroductionCard", "GrayCard", "FlowGrayCard", "BigInfoCard", "SmallInfoCard", "CardGroupBase", "CardGroup", "WidgetGroup", "FlowCardGroup", "FlowWidgetGroup", "VirtualCardGroup", "VirtualWidgetGroup"],
+    "file_chooser": ["FileChooser"],
+    "image": ["ImageCache", "imageCache", "readImage", "ImageLoader", "imageLoader", "Image", "WebImage"],
+    "loading": ["LoadingTrackerBase", "LoadingCard", "LoadingMessageBox"],
+    "page": ["BetterScrollArea", "PageInfoBase", "LazyPage", "BasicEmptyPage", "BasicPage", "BasicTabPage", "BasicTab", "ChangeableTab", "ToolBar"],
+    "scroll": ["ScrollMessageBoxBase", "ScrollMessageBox", "ScrollDialog"],
+    "widget": ["StatisticsWidget", "ComboBoxWithLabel", "PageSpliter", "PageDataSource", "LineEditWithLabel"],
+    "window": ["WindowEffectBase", "Window"],
+    "flyout": ["NewFlyoutAnimationType", "FadeInFlyoutAnimationManager", "DummyFlyoutAnimationManager"],
+    "info_badge": ["NewInfoBadgePosition", "BottomCenterInfoBadgeManager"],
+    "splash_screen": ["SimpleSplashScreen"],
+    "progress": ["ProgressSink", "ProgressTask", "ProgressTracker", "CustomProgressRing", "PartialProgressRing", "CustomProgressBar"],
+}
+
+_NAMES = {name: module for module, names in _MODULES.items() for name in names}
+
+
+def _loadAll():
+    """
+    导入全部组件模块，返回与逐个星号导入等价的名称表
+    """
+    namespace = {}
+    for module in _MODULES:
+        module = importlib.import_module(f".{module}", __name__)
+        namespace.update({k: v for k, v in vars(module).items() if not k.startswith("_")})
+    return namespace
+
+
+def __getattr__(name: str):
+    """
+    按需导入组件所在的模块，子模块名直接导入对应子模块，未登记的名称依次从base和全部组件模块中查找
+    """
+    if name == "__all__":
+        names = list(_loadAll().keys())
+        globals()["__all__"] = names
+        return names
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        return importlib.import_module(f".{name}", __name__)
+
+    module = _NAMES.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f".{module}", __name__), name)
+    else:
+        base = importlib.import_module("..base", __name__)
+        value = getattr(base, name, None)
+        if value is None or isinstance(value, ModuleType):
+            namespace = _loadAll()
+            if name not in namespace:
+                raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+            value = namespace[name]
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_NAMES))
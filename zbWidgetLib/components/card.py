@@ -1,5 +1,7 @@
 from ..base import *
 from .image import *
+import bisect
+import contextlib
 from .widget import StatisticsWidget
 
 
@@ -81,7 +83,7 @@ class IntroductionCard(ElevatedCardWidget):
         设置图片
         :param path: 路径
         :param url: 连接
-        :param thread_pool: 下载线程池
+        :param thread_pool: 已弃用，下载由内置的imageLoader调度
         """
         self.image.setImg(path, url, thread_pool)
 
@@ -353,7 +355,7 @@ class BigInfoCard(CardWidget):
         设置图片
         :param path: 路径
         :param url: 链接
-        :param thread_pool: 线程池
+        :param thread_pool: 已弃用，下载由内置的imageLoader调度
         """
         self.image.setImg(path, url, thread_pool)
 
@@ -651,7 +653,7 @@ class SmallInfoCard(CardWidget):
         设置图片
         :param path: 路径
         :param url: 链接
-        :param thread_pool: 线程池
+        :param thread_pool: 已弃用，下载由内置的imageLoader调度
         """
         self.image.setImg(path, url, thread_pool)
 
@@ -684,50 +686,231 @@ class SmallInfoCard(CardWidget):
         self.contentLabel1.adjustSize()
 
 
-class CardGroup(QWidget):
-    cardCountChanged = pyqtSignal(int)
+class _CardIndex:
+    """
+    有序卡片索引，卡片id分块存储，块长度由树状数组维护，按id查找和删除为O(1)，按位置插入和定位为O(log n)
+    """
+    BLOCK_SIZE = 256
+
+    def __init__(self):
+        self.map = {}
+        self._blocks = []
+        self._blockOf = {}
+        self._blockIndex = {}
+        self._tree = [0]
+
+    def __len__(self):
+        return len(self.map)
+
+    def __bool__(self):
+        return bool(self.map)
+
+    def __contains__(self, wid):
+        return wid in self.map
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+    def _rebuild(self):
+        self._blockIndex = {id(block): i for i, block in enumerate(self._blocks)}
+        tree = [0] * (len(self._blocks) + 1)
+        for i, block in enumerate(self._blocks, 1):
+            tree[i] += len(block)
+            j = i + (i & -i)
+            if j < len(tree):
+                tree[j] += tree[i]
+        self._tree = tree
+
+    def _add(self, i: int, delta: int):
+        i += 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, i: int):
+        total = 0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _locate(self, pos: int):
+        i = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            j = i + step
+            if j < len(self._tree) and self._tree[j] <= pos:
+                i = j
+                pos -= self._tree[j]
+            step >>= 1
+        return i, pos
+
+    def get(self, wid):
+        return self.map.get(wid)
+
+    def index(self, wid):
+        """
+        获取卡片位置
+        :param wid: 卡片组件id
+        :return: 位置索引
+        """
+        block = self._blockOf[wid]
+        return self._prefix(self._blockIndex[id(block)]) + block.index(wid)
 
-    @functools.singledispatchmethod
-    def __init__(self, parent=None, show_title: bool = False, is_v: bool = True):
+    def at(self, pos: int):
         """
-        卡片组
-        :param parent:
-        :param show_title: 是否显示标题
-        :param is_v: 是否竖向排列
+        获取位置上的卡片id
+        :param pos: 位置索引
+        :return: 卡片组件id
         """
-        super().__init__(parent=parent)
-        self.show_title = show_title
-        self.is_v = is_v
-        self._cards = []
-        self._cardMap = {}
+        i, offset = self._locate(pos)
+        return self._blocks[i][offset]
 
-        if show_title:
-            self.titleLabel = StrongBodyLabel(self)
-        if self.is_v:
-            self.boxLayout = QVBoxLayout(self)
+    def insert(self, pos: int, wid, card):
+        """
+        插入卡片
+        :param pos: 位置索引（0到卡片数量）
+        :param wid: 卡片组件id
+        :param card: 卡片组件
+        """
+        if not self._blocks:
+            self._blocks.append([])
+            self._rebuild()
+        if pos >= len(self.map):
+            i = len(self._blocks) - 1
+            offset = len(self._blocks[i])
         else:
-            self.boxLayout = QHBoxLayout(self)
-        self.boxLayout.setSpacing(5)
-        self.boxLayout.setContentsMargins(0, 0, 0, 0)
-        self.boxLayout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        if show_title:
-            self.boxLayout.addWidget(self.titleLabel)
-            self.boxLayout.addSpacing(12)
-
-        self.vBoxLayout = self.boxLayout
-        self.hBoxLayout = self.boxLayout
+            i, offset = self._locate(pos)
+        block = self._blocks[i]
+        block.insert(offset, wid)
+        self.map[wid] = card
+        self._blockOf[wid] = block
+        if len(block) > 2 * self.BLOCK_SIZE:
+            new = block[self.BLOCK_SIZE:]
+            del block[self.BLOCK_SIZE:]
+            for w in new:
+                self._blockOf[w] = new
+            self._blocks.insert(i + 1, new)
+            self._rebuild()
+        else:
+            self._add(i, 1)
 
-    @__init__.register
-    def _(self, title: str, parent=None, is_v: bool = True):
+    def pop(self, wid):
         """
-        卡片组
-        :param title: 标题文本
-        :param parent:
-        :param is_v: 是否竖向排列
+        移除卡片
+        :param wid: 卡片组件id
+        :return: 卡片组件
         """
-        self.__init__(parent, True, is_v)
-        if title and self.show_title:
-            self.titleLabel.setText(title)
+        card = self.map.pop(wid)
+        block = self._blockOf.pop(wid)
+        block.remove(wid)
+        i = self._blockIndex[id(block)]
+        if block:
+            self._add(i, -1)
+        else:
+            del self._blocks[i]
+            self._rebuild()
+        return card
+
+    def cards(self):
+        return [self.map[wid] for wid in self]
+
+    def wids(self):
+        return list(self)
+
+    def clear(self):
+        """
+        清空索引
+        :return: 按顺序排列的卡片组件列表
+        """
+        cards = self.cards()
+        self.map.clear()
+        self._blocks = []
+        self._blockOf = {}
+        self._rebuild()
+        return cards
+
+
+def _longestIncreasing(seq: list):
+    """
+    最长递增子序列
+    :param seq: 数字列表
+    :return: 子序列在seq中的索引列表
+    """
+    tails = []
+    tailIndex = []
+    prev = [-1] * len(seq)
+    for i, value in enumerate(seq):
+        j = bisect.bisect_left(tails, value)
+        if j == len(tails):
+            tails.append(value)
+            tailIndex.append(i)
+        else:
+            tails[j] = value
+            tailIndex[j] = i
+        prev[i] = tailIndex[j - 1] if j else -1
+    result = []
+    i = tailIndex[-1] if tailIndex else -1
+    while i != -1:
+        result.append(i)
+        i = prev[i]
+    return result[::-1]
+
+
+class CardGroupBase:
+    """
+    卡片组公共方法，子类需要提供cardCountChanged信号、_cardIndex、_cardLayout和_insertCard
+    """
+    _batchDepth = 0
+    _batchCount = 0
+    _batchUpdatesEnabled = True
+
+    def _layoutOffset(self):
+        return self._cardLayout().count() - len(self._cardIndex)
+
+    def _takeCard(self, index: int, card):
+        layout = self._cardLayout()
+        item = layout.itemAt(index)
+        if item is not None and item.widget() is card:
+            layout.takeAt(index)
+        else:
+            layout.removeWidget(card)
+
+    def _countChanged(self):
+        if not self._batchDepth:
+            self.cardCountChanged.emit(self.count())
+
+    def isBatchUpdating(self):
+        """
+        是否正在批量更新
+        :return: 是否
+        """
+        return self._batchDepth > 0
+
+    @contextlib.contextmanager
+    def batchUpdate(self):
+        """
+        批量更新卡片，期间暂停界面刷新、布局计算和cardCountChanged信号，结束时只刷新一次布局并发送一次信号，可嵌套使用
+        """
+        if not self._batchDepth:
+            self._batchCount = self.count()
+            self._batchUpdatesEnabled = self.updatesEnabled()
+            self.setUpdatesEnabled(False)
+            self._cardLayout().setEnabled(False)
+        self._batchDepth += 1
+        try:
+            yield self
+        finally:
+            self._batchDepth -= 1
+            if not self._batchDepth:
+                layout = self._cardLayout()
+                layout.setEnabled(True)
+                layout.invalidate()
+                layout.activate()
+                self.setUpdatesEnabled(self._batchUpdatesEnabled)
+                if self.count() != self._batchCount:
+                    self.cardCountChanged.emit(self.count())
 
     def addCard(self, card, wid: str | int = None, pos: int = -1):
         """
@@ -735,17 +918,17 @@ class CardGroup(QWidget):
         :param card: 卡片组件
         :param wid: 卡片组件id（默认使用card）
         :param pos: 卡片放置位置索引（正数0开始，倒数-1开始）
+        :return: 卡片组件id
         """
         if not wid:
             wid = hex(id(card))
-        if wid in self._cardMap:
+        if wid in self._cardIndex:
             raise KeyError
-        if pos >= 0:
-            pos += 1
-        self.boxLayout.insertWidget(pos, card, 0, Qt.AlignmentFlag.AlignTop)
-        self._cards.append(card)
-        self._cardMap[wid] = card
-        self.cardCountChanged.emit(self.count())
+        count = len(self._cardIndex)
+        if pos < 0:
+            pos += count + 1
+        self._attachCard(min(max(pos, 0), count), wid, card)
+        self._countChanged()
         return wid
 
     def addWidget(self, card, wid: str | int = None, pos: int = -1):
@@ -754,32 +937,92 @@ class CardGroup(QWidget):
         :param card: 卡片组件
         :param wid: 卡片组件id（默认使用card）
         :param pos: 卡片放置位置索引（正数0开始，倒数-1开始）
+        :return: 卡片组件id
         """
-        self.addCard(card, wid, pos)
+        return self.addCard(card, wid, pos)
+
+    def addCards(self, cards, pos: int = -1):
+        """
+        批量添加卡片，只进行一次布局并发送一次cardCountChanged信号
+        :param cards: 卡片组件或(卡片组件, 卡片组件id)的可迭代对象
+        :param pos: 第一张卡片放置位置索引（正数0开始，倒数-1开始）
+        :return: 卡片组件id列表
+        """
+        wids = []
+        with self.batchUpdate():
+            for card in cards:
+                wid = None
+                if isinstance(card, tuple):
+                    card, wid = card
+                wids.append(self.addCard(card, wid, pos))
+                if pos >= 0:
+                    pos += 1
+        return wids
+
+    def addWidgets(self, cards, pos: int = -1):
+        """
+        批量添加卡片，只进行一次布局并发送一次cardCountChanged信号
+        :param cards: 卡片组件或(卡片组件, 卡片组件id)的可迭代对象
+        :param pos: 第一张卡片放置位置索引（正数0开始，倒数-1开始）
+        :return: 卡片组件id列表
+        """
+        return self.addCards(cards, pos)
 
     def removeCard(self, wid: str | int):
         """
         移除卡片
         :param wid: 卡片组件id
         """
-        if wid not in self._cardMap:
+        if wid not in self._cardIndex:
             return
 
-        card = self._cardMap.pop(wid)
-        self._cards.remove(card)
-        self.boxLayout.removeWidget(card)
+        card = self._detachCard(wid)
         card.hide()
         card.deleteLater()
 
-        self.cardCountChanged.emit(self.count())
+        self._countChanged()
         return wid
 
-    def removeWidget(self, wid: int | str):
+    def removeWidget(self, wid: str | int):
         """
         移除卡片
         :param wid: 卡片组件id
         """
-        self.removeCard(wid)
+        return self.removeCard(wid)
+
+    def _detachCard(self, wid):
+        index = self._layoutOffset() + self._cardIndex.index(wid)
+        card = self._cardIndex.pop(wid)
+        self._takeCard(index, card)
+        return card
+
+    def _attachCard(self, pos: int, wid, card):
+        self._insertCard(self._layoutOffset() + pos, card)
+        self._cardIndex.insert(pos, wid, card)
+
+    def moveCard(self, wid: str | int, pos: int):
+        """
+        移动卡片
+        :param wid: 卡片组件id
+        :param pos: 目标位置索引（正数0开始，倒数-1开始）
+        """
+        if wid not in self._cardIndex:
+            return
+        count = len(self._cardIndex)
+        if pos < 0:
+            pos += count
+        pos = min(max(pos, 0), count - 1)
+        if self._cardIndex.index(wid) == pos:
+            return
+        self._attachCard(pos, wid, self._detachCard(wid))
+
+    def moveWidget(self, wid: str | int, pos: int):
+        """
+        移动卡片
+        :param wid: 卡片组件id
+        :param pos: 目标位置索引（正数0开始，倒数-1开始）
+        """
+        self.moveCard(wid, pos)
 
     def getCard(self, wid: str | int):
         """
@@ -787,7 +1030,7 @@ class CardGroup(QWidget):
         :param wid: 卡片组件id
         :return: 卡片组件
         """
-        return self._cardMap.get(wid)
+        return self._cardIndex.get(wid)
 
     def getWidget(self, wid: str | int):
         """
@@ -795,35 +1038,45 @@ class CardGroup(QWidget):
         :param wid: 卡片组件id
         :return: 卡片组件
         """
-        self.getCard(wid)
+        return self.getCard(wid)
+
+    def getCardIndex(self, wid: str | int):
+        """
+        获取卡片位置
+        :param wid: 卡片组件id
+        :return: 位置索引，不存在时为-1
+        """
+        if wid not in self._cardIndex:
+            return -1
+        return self._cardIndex.index(wid)
 
     def getCards(self):
         """
         获取卡片
-        :return:
+        :return: 按显示顺序排列的卡片组件列表
         """
-        return self._cards
+        return self._cardIndex.cards()
 
     def getWidgets(self):
         """
         获取卡片
-        :return:
+        :return: 按显示顺序排列的卡片组件列表
         """
         return self.getCards()
 
     def getWids(self):
         """
         获取组件id
-        :return:
+        :return: 按显示顺序排列的卡片组件id列表
         """
-        return list(self._cardMap.keys())
+        return self._cardIndex.wids()
 
     def getCardMap(self):
         """
         获取wid卡片映射表
         :return:
         """
-        return self._cardMap
+        return self._cardIndex.map
 
     def getWidgetMap(self):
         """
@@ -837,14 +1090,24 @@ class CardGroup(QWidget):
         卡片数量
         :return: 卡片数量
         """
-        return len(self._cards)
+        return len(self._cardIndex)
 
     def clearCard(self):
         """
-        清空卡片
+        清空卡片，一次性移除全部卡片并只发送一次cardCountChanged信号
         """
-        while self._cardMap:
-            self.removeCard(next(iter(self._cardMap)))
+        if not self._cardIndex:
+            return
+        with self.batchUpdate():
+            layout = self._cardLayout()
+            ids = {id(card) for card in self._cardIndex.map.values()}
+            for i in range(layout.count() - 1, -1, -1):
+                item = layout.itemAt(i)
+                if item is not None and id(item.widget()) in ids:
+                    layout.takeAt(i)
+            for card in self._cardIndex.clear():
+                card.hide()
+                card.deleteLater()
 
     def clearWidget(self):
         """
@@ -852,6 +1115,107 @@ class CardGroup(QWidget):
         """
         self.clearCard()
 
+    def setItems(self, items, factory, updater=None, key=None):
+        """
+        按新的数据列表增量更新卡片：复用id相同的卡片，只创建新增的、删除消失的、移动顺序变化的卡片，整个过程只进行一次布局并发送一次cardCountChanged信号
+        :param items: 数据列表，未指定key时数据本身即为卡片组件id
+        :param factory: 创建卡片的函数，参数为数据，返回卡片组件
+        :param updater: 更新已有卡片的函数，参数为卡片组件和数据，为None时不更新
+        :param key: 从数据获取卡片组件id的函数，为None时使用数据本身
+        """
+        items = list(items)
+        wids = [key(item) for item in items] if key else items
+        if len(set(wids)) != len(wids):
+            raise KeyError("duplicate card id")
+        with self.batchUpdate():
+            new = set(wids)
+            for wid in [wid for wid in self._cardIndex if wid not in new]:
+                self.removeCard(wid)
+
+            old = {wid: i for i, wid in enumerate(self._cardIndex)}
+            kept = [i for i, wid in enumerate(wids) if wid in old]
+            stable = {wids[kept[i]] for i in _longestIncreasing([old[wids[i]] for i in kept])}
+
+            anchor = None
+            for wid, item in zip(reversed(wids), reversed(items)):
+                card = self._cardIndex.get(wid)
+                if card is None:
+                    card = factory(item)
+                elif wid in stable:
+                    if updater:
+                        updater(card, item)
+                    anchor = wid
+                    continue
+                else:
+                    self._detachCard(wid)
+                    if updater:
+                        updater(card, item)
+                pos = len(self._cardIndex) if anchor is None else self._cardIndex.index(anchor)
+                self._attachCard(pos, wid, card)
+                anchor = wid
+
+    def setWidgets(self, items, factory, updater=None, key=None):
+        """
+        按新的数据列表增量更新卡片
+        :param items: 数据列表，未指定key时数据本身即为卡片组件id
+        :param factory: 创建卡片的函数，参数为数据，返回卡片组件
+        :param updater: 更新已有卡片的函数，参数为卡片组件和数据，为None时不更新
+        :param key: 从数据获取卡片组件id的函数，为None时使用数据本身
+        """
+        self.setItems(items, factory, updater, key)
+
+
+class CardGroup(QWidget, CardGroupBase):
+    cardCountChanged = pyqtSignal(int)
+
+    @functools.singledispatchmethod
+    def __init__(self, parent=None, show_title: bool = False, is_v: bool = True):
+        """
+        卡片组
+        :param parent:
+        :param show_title: 是否显示标题
+        :param is_v: 是否竖向排列
+        """
+        super().__init__(parent=parent)
+        self.show_title = show_title
+        self.is_v = is_v
+        self._cardIndex = _CardIndex()
+        self._cardMap = self._cardIndex.map
+
+        if show_title:
+            self.titleLabel = StrongBodyLabel(self)
+        if self.is_v:
+            self.boxLayout = QVBoxLayout(self)
+        else:
+            self.boxLayout = QHBoxLayout(self)
+        self.boxLayout.setSpacing(5)
+        self.boxLayout.setContentsMargins(0, 0, 0, 0)
+        self.boxLayout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        if show_title:
+            self.boxLayout.addWidget(self.titleLabel)
+            self.boxLayout.addSpacing(12)
+
+        self.vBoxLayout = self.boxLayout
+        self.hBoxLayout = self.boxLayout
+
+    @__init__.register
+    def _(self, title: str, parent=None, is_v: bool = True):
+        """
+        卡片组
+        :param title: 标题文本
+        :param parent:
+        :param is_v: 是否竖向排列
+        """
+        self.__init__(parent, True, is_v)
+        if title and self.show_title:
+            self.titleLabel.setText(title)
+
+    def _cardLayout(self):
+        return self.boxLayout
+
+    def _insertCard(self, index: int, card):
+        self.boxLayout.insertWidget(index, card, 0, Qt.AlignmentFlag.AlignTop)
+
     def getTitle(self):
         """
         获取标题
@@ -884,7 +1248,7 @@ class CardGroup(QWidget):
 WidgetGroup = CardGroup
 
 
-class FlowCardGroup(QWidget):
+class FlowCardGroup(QWidget, CardGroupBase):
     cardCountChanged = pyqtSignal(int)
 
     def __init__(self, parent=None):
@@ -895,8 +1259,8 @@ class FlowCardGroup(QWidget):
         :param is_v: 是否竖向排列
         """
         super().__init__(parent=parent)
-        self._cards = []
-        self._cardMap = {}
+        self._cardIndex = _CardIndex()
+        self._cardMap = self._cardIndex.map
 
         self.flowLayout = FlowLayout(self)
         self.flowLayout.setSpacing(5)
@@ -906,132 +1270,279 @@ class FlowCardGroup(QWidget):
         self.vBoxLayout = self.flowLayout
         self.hBoxLayout = self.flowLayout
 
-    def addCard(self, card, wid: str | int = None, pos: int = -1):
+    def _cardLayout(self):
+        return self.flowLayout
+
+    def _insertCard(self, index: int, card):
+        self.flowLayout.insertWidget(index, card)
+
+
+FlowWidgetGroup = FlowCardGroup
+
+
+class VirtualCardGroup(QWidget):
+    cardCountChanged = pyqtSignal(int)
+
+    def __init__(self, card_factory, updater, card_height: int, parent=None, spacing: int = 5, overscan: int = 2):
         """
-        添加卡片
-        :param card: 卡片组件
-        :param wid: 卡片组件id（默认使用card）
-        :param pos: 卡片放置位置索引（正数0开始，倒数-1开始）
+        虚拟化卡片组，由数据列表驱动，仅为滚动区域可见范围内的数据创建卡片，滚动时复用卡片组件
+        :param card_factory: 创建空白卡片的函数，无参数，返回卡片组件；卡片会被复用于不同数据，数据统一由updater填充，与CardGroup.setItems中参数为数据的factory不同
+        :param updater: 将数据填充到卡片的函数，参数为卡片组件和数据
+        :param card_height: 卡片高度
+        :param parent:
+        :param spacing: 卡片间距
+        :param overscan: 可见范围上下额外保留的卡片数量
         """
-        if not wid:
-            wid = hex(id(card))
-        if wid in self._cardMap:
-            raise KeyError
-        if pos == -1:
-            pos = len(self._cardMap)
-        elif pos < -1:
-            pos += 1
-        if pos > len(self._cardMap):
-            pos = len(self._cardMap)
-        self.flowLayout.insertWidget(pos, card)
-        self._cards.append(card)
-        self._cardMap[wid] = card
-        self.cardCountChanged.emit(self.count())
-        return wid
+        super().__init__(parent=parent)
+        self._cardFactory = card_factory
+        self._updater = updater
+        self._cardHeight = card_height
+        self._spacing = spacing
+        self._overscan = overscan
 
-    def addWidget(self, card, wid: str | int = None, pos: int = -1):
+        self._items = []
+        self._activeCards = {}
+        self._freeCards = []
+        self._scrollArea = None
+        self._layoutWidth = -1
+
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self._updateHeight()
+
+    def setItems(self, items):
         """
-        添加卡片
-        :param card: 卡片组件
-        :param wid: 卡片组件id（默认使用card）
-        :param pos: 卡片放置位置索引（正数0开始，倒数-1开始）
+        设置数据列表
+        :param items: 数据列表
         """
-        self.addCard(card, wid, pos)
+        self._items = list(items)
+        self._reset()
 
-    def removeCard(self, wid: str | int):
+    def getItems(self):
         """
-        移除卡片
-        :param wid: 卡片组件id
+        获取数据列表
+        :return: 数据列表
         """
-        if wid not in self._cardMap:
-            return
+        return self._items
 
-        card = self._cardMap.pop(wid)
-        self._cards.remove(card)
-        self.flowLayout.removeWidget(card)
-        card.hide()
-        card.deleteLater()
+    def items(self):
+        """
+        获取数据列表
+        :return: 数据列表
+        """
+        return self.getItems()
 
-        self.cardCountChanged.emit(self.count())
-        return wid
+    def getItem(self, index: int):
+        """
+        获取数据
+        :param index: 索引
+        :return: 数据
+        """
+        return self._items[index]
 
-    def removeWidget(self, wid: str | int):
+    def addItem(self, item):
         """
-        移除卡片
-        :param wid: 卡片组件id
+        添加数据
+        :param item: 数据
         """
-        self.removeCard(wid)
+        self.insertItem(len(self._items), item)
 
-    def getCard(self, wid: str | int):
+    def addItems(self, items):
         """
-        寻找卡片
-        :param wid: 卡片组件id
-        :return: 卡片组件
+        批量添加数据
+        :param items: 数据列表
         """
-        return self._cardMap.get(wid)
+        self._items.extend(items)
+        self._reset()
 
-    def getWidget(self, wid: str | int):
+    def insertItem(self, index: int, item):
         """
-        寻找卡片
-        :param wid: 卡片组件id
-        :return: 卡片组件
+        插入数据
+        :param index: 索引
+        :param item: 数据
         """
-        self.getCard(wid)
+        self._items.insert(index, item)
+        self._reset()
 
-    def getCards(self):
+    def setItem(self, index: int, item):
         """
-        获取卡片
-        :return:
+        修改数据，已显示的卡片会立即刷新
+        :param index: 索引
+        :param item: 数据
         """
-        return self._cards
+        self._items[index] = item
+        card = self._activeCards.get(index)
+        if card is not None:
+            self._updater(card, item)
 
-    def getWidgets(self):
+    def removeItem(self, index: int):
         """
-        获取卡片
-        :return:
+        移除数据
+        :param index: 索引
         """
-        return self.getCards()
+        del self._items[index]
+        self._reset()
 
-    def getWids(self):
+    def clearItems(self):
         """
-        获取组件id
-        :return:
+        清空数据
         """
-        return list(self._cardMap.keys())
+        self._items = []
+        self._reset()
 
-    def getCardMap(self):
+    def count(self):
         """
-        获取wid卡片映射表
-        :return:
+        数据数量
+        :return: 数据数量
         """
-        return self._cardMap
+        return len(self._items)
 
-    def getWidgetMap(self):
+    def cardAt(self, index: int):
         """
-        获取wid卡片映射表
-        :return:
+        获取正在显示指定数据的卡片
+        :param index: 数据索引
+        :return: 卡片组件，未显示时返回None
         """
-        self.getCardMap()
+        return self._activeCards.get(index)
 
-    def count(self):
+    def getCards(self):
         """
-        卡片数量
-        :return: 卡片数量
+        获取当前创建的所有卡片（包括空闲的卡片）
+        :return: 卡片组件列表
         """
-        return len(self._cards)
+        return list(self._activeCards.values()) + self._freeCards
 
-    def clearCard(self):
+    def setCardHeight(self, height: int):
         """
-        清空卡片
+        设置卡片高度
+        :param height: 高度
         """
-        while self._cardMap:
-            self.removeCard(next(iter(self._cardMap)))
+        self._cardHeight = height
+        self._reset(False)
 
-    def clearWidget(self):
+    def getCardHeight(self):
         """
-        清空卡片
+        获取卡片高度
+        :return: 高度
         """
-        self.clearCard()
+        return self._cardHeight
 
+    def setSpacing(self, spacing: int):
+        """
+        设置卡片间距
+        :param spacing: 间距
+        """
+        self._spacing = spacing
+        self._reset(False)
 
-FlowWidgetGroup = FlowCardGroup
+    def getSpacing(self):
+        """
+        获取卡片间距
+        :return: 间距
+        """
+        return self._spacing
+
+    def setOverscan(self, overscan: int):
+        """
+        设置可见范围上下额外保留的卡片数量
+        :param overscan: 数量
+        """
+        self._overscan = overscan
+        self._updateVisible()
+
+    def _stride(self):
+        return self._cardHeight + self._spacing
+
+    def _updateHeight(self):
+        count = len(self._items)
+        self.setFixedHeight(max(0, count * self._stride() - self._spacing))
+
+    def _reset(self, signal: bool = True):
+        for card in self._activeCards.values():
+            card.hide()
+            self._freeCards.append(card)
+        self._activeCards.clear()
+        self._updateHeight()
+        self._updateVisible()
+        if signal:
+            self.cardCountChanged.emit(self.count())
+
+    def _findScrollArea(self):
+        parent = self.parentWidget()
+        while parent is not None:
+            if isinstance(parent, QAbstractScrollArea):
+                return parent
+            parent = parent.parentWidget()
+        return None
+
+    def _attachScrollArea(self):
+        area = self._findScrollArea()
+        if area is self._scrollArea:
+            return
+        if self._scrollArea is not None:
+            self._scrollArea.verticalScrollBar().valueChanged.disconnect(self._updateVisible)
+            self._scrollArea.viewport().removeEventFilter(self)
+        self._scrollArea = area
+        if area is not None:
+            area.verticalScrollBar().valueChanged.connect(self._updateVisible)
+            area.viewport().installEventFilter(self)
+
+    def _visibleRange(self):
+        if not self._items:
+            return 0, -1
+        top, bottom = 0, self.height()
+        area = self._scrollArea
+        if area is not None and area.viewport().isAncestorOf(self):
+            top = self.mapFrom(area.viewport(), QPoint(0, 0)).y()
+            bottom = top + area.viewport().height()
+        stride = self._stride()
+        first = max(0, top // stride - self._overscan)
+        last = min(len(self._items) - 1, bottom // stride + self._overscan)
+        return first, last
+
+    def _updateVisible(self, *args):
+        if not self.isVisible():
+            return
+        first, last = self._visibleRange()
+        for index in [i for i in self._activeCards if i < first or i > last]:
+            card = self._activeCards.pop(index)
+            card.hide()
+            self._freeCards.append(card)
+
+        width = self.width()
+        stride = self._stride()
+        relayout = width != self._layoutWidth
+        self._layoutWidth = width
+        for index in range(first, last + 1):
+            card = self._activeCards.get(index)
+            if card is None:
+                if self._freeCards:
+                    card = self._freeCards.pop()
+                else:
+                    card = self._cardFactory()
+                    card.setParent(self)
+                self._updater(card, self._items[index])
+                self._activeCards[index] = card
+                card.setGeometry(0, index * stride, width, self._cardHeight)
+                card.show()
+            elif relayout:
+                card.setGeometry(0, index * stride, width, self._cardHeight)
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._attachScrollArea()
+        self._updateVisible()
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self._updateVisible()
+
+    def eventFilter(self, obj, e):
+        if e.type() == QEvent.Resize:
+            self._updateVisible()
+        return super().eventFilter(obj, e)
+
+    def sizeHint(self):
+        return QSize(super().sizeHint().width(), self.height())
+
+
+VirtualWidgetGroup = VirtualCardGroup
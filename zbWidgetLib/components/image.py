@@ -1,9 +1,632 @@
 from ..base import *
 from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+import hashlib
+import heapq
+import itertools
+import os
+import shutil
+import tempfile
+import threading
+import urllib.parse
+import weakref
 
 from qfluentwidgets.common.icon import toQIcon
 
 
+class ImageCache:
+    def __init__(self, budget: int = 64 * 1024 * 1024, disk_path: str = None):
+        """
+        图片缓存，内存中按路径和目标尺寸缓存QPixmap（按字节预算LRU淘汰），磁盘中按链接哈希缓存图片文件
+        :param budget: 内存缓存字节预算
+        :param disk_path: 磁盘缓存目录，不填默认使用系统临时目录
+        """
+        self._lock = threading.RLock()
+        self._pixmaps = OrderedDict()
+        self._budget = budget
+        self._size = 0
+        self._diskPath = disk_path or zb.joinPath(tempfile.gettempdir(), "zbWidgetLib", "ImageCache")
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._diskHits = 0
+        self._diskMisses = 0
+
+    @staticmethod
+    def _cost(pixmap: QPixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    @staticmethod
+    def _key(path: str, size: QSize):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        return path, mtime, size.width(), size.height()
+
+    def _evict(self):
+        while self._size > self._budget and self._pixmaps:
+            _, pixmap = self._pixmaps.popitem(last=False)
+            self._size -= self._cost(pixmap)
+            self._evictions += 1
+
+    def setBudget(self, budget: int):
+        """
+        设置内存缓存字节预算
+        :param budget: 字节数
+        """
+        with self._lock:
+            self._budget = budget
+            self._evict()
+
+    def getBudget(self):
+        """
+        获取内存缓存字节预算
+        :return: 字节数
+        """
+        return self._budget
+
+    def setDiskPath(self, path: str):
+        """
+        设置磁盘缓存目录
+        :param path: 目录路径
+        """
+        self._diskPath = path
+
+    def getDiskPath(self):
+        """
+        获取磁盘缓存目录
+        :return: 目录路径
+        """
+        return self._diskPath
+
+    def find(self, path: str, size: QSize):
+        """
+        查找缩放至目标尺寸的缓存图片
+        :param path: 图片路径
+        :param size: 目标尺寸（设备像素）
+        :return: QPixmap，未命中返回None
+        """
+        key = self._key(path, size)
+        if key is None:
+            return None
+        with self._lock:
+            pixmap = self._pixmaps.get(key)
+            if pixmap is not None:
+                self._pixmaps.move_to_end(key)
+                self._hits += 1
+                return pixmap
+            self._misses += 1
+        return None
+
+    def insert(self, path: str, size: QSize, pixmap: QPixmap):
+        """
+        加入缓存
+        :param path: 图片路径
+        :param size: 目标尺寸（设备像素）
+        :param pixmap: 已缩放的图片
+        """
+        key = self._key(path, size)
+        if key is None or pixmap.isNull():
+            return
+        with self._lock:
+            old = self._pixmaps.pop(key, None)
+            if old is not None:
+                self._size -= self._cost(old)
+            self._pixmaps[key] = pixmap
+            self._size += self._cost(pixmap)
+            self._evict()
+
+    def pixmap(self, path: str, size: QSize):
+        """
+        获取缩放至目标尺寸的图片，未命中时在当前线程解码并加入缓存
+        :param path: 图片路径
+        :param size: 目标尺寸（设备像素）
+        :return: QPixmap
+        """
+        pixmap = self.find(path, size)
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(readImage(path, size))
+            self.insert(path, size, pixmap)
+        return pixmap
+
+    def diskFile(self, url: str):
+        """
+        获取链接对应的磁盘缓存文件路径
+        :param url: 链接
+        :return: 文件路径
+        """
+        suffix = os.path.splitext(urllib.parse.urlparse(url).path)[1][:8]
+        return zb.joinPath(self._diskPath, hashlib.sha1(url.encode("utf-8")).hexdigest() + suffix)
+
+    def loadFromDisk(self, url: str, path: str):
+        """
+        从磁盘缓存中复制链接对应的图片到指定路径
+        :param url: 链接
+        :param path: 目标路径
+        :return: 是否命中
+        """
+        file = self.diskFile(url)
+        if not os.path.isfile(file):
+            with self._lock:
+                self._diskMisses += 1
+            return False
+        try:
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            shutil.copyfile(file, path)
+        except OSError:
+            with self._lock:
+                self._diskMisses += 1
+            return False
+        with self._lock:
+            self._diskHits += 1
+        return True
+
+    def saveToDisk(self, url: str, path: str):
+        """
+        将已下载的图片存入磁盘缓存
+        :param url: 链接
+        :param path: 图片路径
+        """
+        file = self.diskFile(url)
+        if os.path.isfile(file) or not os.path.isfile(path):
+            return
+        try:
+            os.makedirs(self._diskPath, exist_ok=True)
+            temp = f"{file}.{threading.get_ident()}.tmp"
+            shutil.copyfile(path, temp)
+            os.replace(temp, file)
+        except OSError:
+            pass
+
+    def clear(self, disk: bool = False):
+        """
+        清空缓存
+        :param disk: 是否同时清空磁盘缓存
+        """
+        with self._lock:
+            self._pixmaps.clear()
+            self._size = 0
+        if disk:
+            shutil.rmtree(self._diskPath, ignore_errors=True)
+
+    def stats(self):
+        """
+        获取缓存统计信息
+        :return: 统计信息字典
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "disk_hits": self._diskHits,
+                "disk_misses": self._diskMisses,
+                "count": len(self._pixmaps),
+                "size": self._size,
+                "budget": self._budget,
+            }
+
+
+imageCache = ImageCache()
+
+
+def readImage(path: str, size: QSize = None):
+    """
+    读取图片并缩放至目标尺寸，可在非GUI线程中调用
+    :param path: 图片路径
+    :param size: 目标尺寸（设备像素），不填则保持原尺寸
+    :return: QImage
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    if size is not None and not size.isEmpty():
+        reader.setScaledSize(size)
+    image = reader.read()
+    if not image.isNull() and size is not None and not size.isEmpty() and image.size() != size:
+        image = image.scaled(size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    return image
+
+
+class _LoadTask:
+    __slots__ = ("key", "url", "path", "size", "host", "priority", "seq", "waiters", "started", "cancelled")
+
+    def __init__(self, key, url: str, path: str, size: QSize, host: str, priority: int):
+        self.key = key
+        self.url = url
+        self.path = path
+        self.size = size
+        self.host = host
+        self.priority = priority
+        self.seq = 0
+        self.waiters = {}
+        self.started = False
+        self.cancelled = False
+
+
+class _ImageLoaderRelay(QObject):
+    decodedSignal = pyqtSignal(object)
+
+    def __init__(self, loader):
+        super().__init__()
+        self._loader = loader
+        self.decodedSignal.connect(self._onDecoded)
+
+    def _onDecoded(self, data):
+        self._loader._onDecoded(*data)
+
+
+class ImageLoader:
+    VISIBLE_PRIORITY = 0
+    HIDDEN_PRIORITY = 10
+    IDLE_TIMEOUT = 30
+
+    def __init__(self, max_workers: int = 4, max_per_host: int = 2, max_decode_workers: int = 2):
+        """
+        图片加载服务，内置有界线程池和优先级队列，负责下载和解码缩放图片，相同的并发请求会合并为一次执行
+        下载和解码使用各自的线程，解码不会排在慢速下载之后
+        :param max_workers: 最大下载线程数
+        :param max_per_host: 单个域名最大并发下载数
+        :param max_decode_workers: 最大解码线程数
+        """
+        self._cond = threading.Condition()
+        self._queues = {"download": [], "decode": []}
+        self._tasks = {}
+        self._widgetTasks = {}
+        self._hostActive = {}
+        self._seq = itertools.count()
+        self._workers = {"download": 0, "decode": 0}
+        self._idleWorkers = {"download": 0, "decode": 0}
+        self._maxWorkers = {"download": max(1, max_workers), "decode": max(1, max_decode_workers)}
+        self._maxPerHost = max(1, max_per_host)
+        self._relay = _ImageLoaderRelay(self)
+
+    def setMaxWorkers(self, max_workers: int):
+        """
+        设置最大下载线程数
+        :param max_workers: 线程数
+        """
+        with self._cond:
+            self._maxWorkers["download"] = max(1, max_workers)
+            self._spawn("download")
+
+    def getMaxWorkers(self):
+        """
+        获取最大下载线程数
+        :return: 线程数
+        """
+        return self._maxWorkers["download"]
+
+    def setMaxDecodeWorkers(self, max_decode_workers: int):
+        """
+        设置最大解码线程数
+        :param max_decode_workers: 线程数
+        """
+        with self._cond:
+            self._maxWorkers["decode"] = max(1, max_decode_workers)
+            self._spawn("decode")
+
+    def getMaxDecodeWorkers(self):
+        """
+        获取最大解码线程数
+        :return: 线程数
+        """
+        return self._maxWorkers["decode"]
+
+    def setMaxPerHost(self, max_per_host: int):
+        """
+        设置单个域名最大并发下载数
+        :param max_per_host: 并发数
+        """
+        with self._cond:
+            self._maxPerHost = max(1, max_per_host)
+            self._cond.notify_all()
+
+    def getMaxPerHost(self):
+        """
+        获取单个域名最大并发下载数
+        :return: 并发数
+        """
+        return self._maxPerHost
+
+    def request(self, widget, url: str, path: str, priority: int = None):
+        """
+        请求加载图片，同一组件的旧请求会被取消
+        :param widget: 等待结果的WebImage
+        :param url: 链接
+        :param path: 保存路径
+        :param priority: 优先级，数值越小越优先，不填则可见组件优先
+        """
+        self._submit(widget, ("download", url), url, path, None, urllib.parse.urlparse(url).netloc, priority)
+
+    def decode(self, widget, path: str, size: QSize, priority: int = None):
+        """
+        请求在工作线程中解码并缩放图片，完成后在GUI线程调用组件的_onImageDecoded，同一组件的旧请求会被取消
+        :param widget: 等待结果的组件
+        :param path: 图片路径
+        :param size: 目标尺寸（设备像素）
+        :param priority: 优先级，数值越小越优先，不填则可见组件优先
+        """
+        self._submit(widget, ("decode", path, size.width(), size.height()), None, path, QSize(size), "", priority)
+
+    def _submit(self, widget, key, url: str, path: str, size: QSize, host: str, priority: int):
+        if priority is None:
+            priority = self.VISIBLE_PRIORITY if widget.isVisible() else self.HIDDEN_PRIORITY
+        wid = id(widget)
+        with self._cond:
+            self._cancel(wid)
+            task = self._tasks.get(key)
+            if task is None:
+                task = _LoadTask(key, url, path, size, host, priority)
+                self._tasks[key] = task
+                self._push(task)
+            elif priority < task.priority and not task.started:
+                task.priority = priority
+                self._push(task)
+            task.waiters[wid] = (weakref.ref(widget), path)
+            self._widgetTasks[wid] = key
+
+    def setPriority(self, widget, priority: int):
+        """
+        修改组件当前请求的优先级
+        :param widget: WebImage或其id
+        :param priority: 优先级，数值越小越优先
+        """
+        wid = widget if isinstance(widget, int) else id(widget)
+        with self._cond:
+            task = self._tasks.get(self._widgetTasks.get(wid))
+            if task and not task.started and task.priority != priority:
+                task.priority = priority
+                self._push(task)
+
+    def cancel(self, widget):
+        """
+        取消组件当前的请求，没有其他组件等待时会从队列中移除
+        :param widget: WebImage或其id
+        """
+        wid = widget if isinstance(widget, int) else id(widget)
+        with self._cond:
+            self._cancel(wid)
+
+    def isLoading(self, url: str):
+        """
+        链接是否正在加载
+        :param url: 链接
+        :return: 是否
+        """
+        with self._cond:
+            return ("download", url) in self._tasks
+
+    def pendingCount(self):
+        """
+        等待及正在执行的请求数量
+        :return: 数量
+        """
+        with self._cond:
+            return len(self._tasks)
+
+    def _cancel(self, wid: int):
+        key = self._widgetTasks.pop(wid, None)
+        task = self._tasks.get(key)
+        if task is None:
+            return
+        task.waiters.pop(wid, None)
+        if not task.waiters and not task.started:
+            task.cancelled = True
+            del self._tasks[key]
+
+    def _push(self, task: _LoadTask):
+        kind = task.key[0]
+        task.seq = next(self._seq)
+        heapq.heappush(self._queues[kind], (task.priority, task.seq, task))
+        self._spawn(kind)
+        self._cond.notify_all()
+
+    def _spawn(self, kind: str):
+        while len(self._queues[kind]) > self._idleWorkers[kind] and self._workers[kind] < self._maxWorkers[kind]:
+            self._workers[kind] += 1
+            threading.Thread(target=self._worker, args=(kind,), name=f"zbWidgetLib-ImageLoader-{kind}", daemon=True).start()
+
+    def _take(self, kind: str):
+        queue = self._queues[kind]
+        skipped = []
+        task = None
+        while queue:
+            _, seq, candidate = heapq.heappop(queue)
+            if candidate.cancelled or candidate.started or candidate.seq != seq:
+                continue
+            if candidate.host and self._hostActive.get(candidate.host, 0) >= self._maxPerHost:
+                skipped.append((candidate.priority, seq, candidate))
+                continue
+            task = candidate
+            break
+        for item in skipped:
+            heapq.heappush(queue, item)
+        return task
+
+    def _worker(self, kind: str):
+        while True:
+            with self._cond:
+                task = self._take(kind)
+                while task is None:
+                    self._idleWorkers[kind] += 1
+                    notified = self._cond.wait(self.IDLE_TIMEOUT)
+                    self._idleWorkers[kind] -= 1
+                    task = self._take(kind)
+                    if task is None and not notified:
+                        self._workers[kind] -= 1
+                        return
+                task.started = True
+                if task.host:
+                    self._hostActive[task.host] = self._hostActive.get(task.host, 0) + 1
+
+            result = None
+            try:
+                if task.size is None:
+                    result = self._download(task.url, task.path)
+                else:
+                    result = readImage(task.path, task.size)
+            except Exception:
+                pass
+            finally:
+                with self._cond:
+                    if task.host:
+                        self._hostActive[task.host] -= 1
+                        if not self._hostActive[task.host]:
+                            del self._hostActive[task.host]
+                    if self._tasks.get(task.key) is task:
+                        del self._tasks[task.key]
+                    waiters, task.waiters = task.waiters, {}
+                    for wid in waiters:
+                        if self._widgetTasks.get(wid) == task.key:
+                            del self._widgetTasks[wid]
+                    self._cond.notify_all()
+                if task.size is None:
+                    self._notify(task, waiters, bool(result))
+                else:
+                    self._relay.decodedSignal.emit((task, waiters, result))
+
+    @staticmethod
+    def _download(url: str, path: str):
+        if zb.existPath(path) or imageCache.loadFromDisk(url, path):
+            return True
+        result = bool(zb.singleDownload(url, path, False, True, zb.REQUEST_HEADER))
+        if result:
+            imageCache.saveToDisk(url, path)
+        return result
+
+    @staticmethod
+    def _notify(task: _LoadTask, waiters: dict, result: bool):
+        for ref, path in waiters.values():
+            widget = ref()
+            if widget is None or getattr(widget, "url", None) != task.url:
+                continue
+            waiter_result = result
+            if result and path != task.path and not zb.existPath(path):
+                waiter_result = imageCache.loadFromDisk(task.url, path)
+                if not waiter_result:
+                    try:
+                        shutil.copyfile(task.path, path)
+                        waiter_result = True
+                    except OSError:
+                        pass
+            try:
+                widget.downloadFinishedSignal.emit(waiter_result)
+            except RuntimeError:
+                pass
+
+    @staticmethod
+    def _onDecoded(task: _LoadTask, waiters: dict, image: QImage):
+        pixmap = QPixmap.fromImage(image) if image is not None and not image.isNull() else QPixmap()
+        imageCache.insert(task.path, task.size, pixmap)
+        for ref, path in waiters.values():
+            widget = ref()
+            if widget is None:
+                continue
+            try:
+                widget._onImageDecoded(path, pixmap)
+            except RuntimeError:
+                pass
+
+
+imageLoader = ImageLoader()
+
+
+def _deviceSize(widget: QWidget):
+    return widget.size() * widget.devicePixelRatioF()
+
+
+def _scaledPixmap(widget: QWidget, pixmap: QPixmap):
+    if not pixmap.isNull():
+        pixmap = QPixmap(pixmap)
+        pixmap.setDevicePixelRatio(widget.devicePixelRatioF())
+    return pixmap
+
+
+def _setImageFile(widget: QWidget, path: str):
+    size = _deviceSize(widget)
+    widget._imagePath = path
+    widget._imageSize = size
+    pixmap = imageCache.find(path, size)
+    if pixmap is None and os.path.isfile(path):
+        widget._decodePath = path
+        imageLoader.decode(widget, path, size)
+        return
+    widget._decodePath = None
+    imageLoader.cancel(widget)
+    widget.setPixmap(_scaledPixmap(widget, pixmap if pixmap is not None else QPixmap()))
+
+
+def _clearImageFile(widget: QWidget):
+    widget._imagePath = None
+    widget._decodePath = None
+    imageLoader.cancel(widget)
+
+
+def _refreshImageFile(widget: QWidget):
+    """
+    组件尺寸或设备像素比变化后，延迟按新的尺寸重新解码图片文件
+    """
+    if widget._imagePath is None or _deviceSize(widget) == widget._imageSize:
+        return
+    timer = widget._refreshTimer
+    if timer is None:
+        timer = QTimer(widget)
+        timer.setSingleShot(True)
+        timer.setInterval(100)
+        timer.timeout.connect(lambda: widget._imagePath is not None and _setImageFile(widget, widget._imagePath))
+        widget._refreshTimer = timer
+    timer.start()
+
+
+class _ViewportWatcher(QObject):
+
+    def __init__(self, area: QAbstractScrollArea):
+        """
+        监听滚动区域的滚动和尺寸变化，通知其中等待加载的WebImage
+        """
+        super().__init__(area)
+        self._images = weakref.WeakSet()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(50)
+        self._timer.timeout.connect(self._check)
+
+        area.verticalScrollBar().valueChanged.connect(self._schedule)
+        area.horizontalScrollBar().valueChanged.connect(self._schedule)
+        area.viewport().installEventFilter(self)
+
+    @classmethod
+    def watch(cls, area: QAbstractScrollArea, image):
+        watcher = getattr(area, "_viewportWatcher", None)
+        if watcher is None:
+            watcher = cls(area)
+            area._viewportWatcher = watcher
+        watcher._images.add(image)
+
+    def _schedule(self):
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _check(self):
+        for image in list(self._images):
+            try:
+                if image.loading:
+                    image._updateLoad()
+                else:
+                    self._images.discard(image)
+            except RuntimeError:
+                self._images.discard(image)
+
+    def eventFilter(self, obj, e):
+        if e.type() == QEvent.Resize:
+            self._schedule()
+        return super().eventFilter(obj, e)
+
+
 class Image(QLabel):
     def __init__(self, parent=None):
         """
@@ -12,24 +635,46 @@ class Image(QLabel):
         super().__init__(parent=parent)
         self.setFixedSize(48, 48)
         self.setScaledContents(True)
+        self._decodePath = None
+        self._imagePath = None
+        self._imageSize = QSize()
+        self._refreshTimer = None
+        self.destroyed.connect(lambda _=None, wid=id(self): imageLoader.cancel(wid))
 
     def setImg(self, img: str | FluentIconBase):
         """
-        设置图片
+        设置图片，图片文件在工作线程中解码并缩放
         :param img: 路径
         :param url: 链接
         :param thread_pool: 下载线程池
         """
         self.loading = False
         if isinstance(img, str):
-            self.setPixmap(QPixmap(img))
+            _setImageFile(self, img)
         elif isinstance(img, FluentIconBase):
+            _clearImageFile(self)
             self.setPixmap(toQIcon(img).pixmap(QSize(100, 100)))
 
+    def _onImageDecoded(self, path: str, pixmap: QPixmap):
+        if self._decodePath != path:
+            return
+        self._decodePath = None
+        self.setPixmap(_scaledPixmap(self, pixmap))
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        _refreshImageFile(self)
+
+    def paintEvent(self, e):
+        _refreshImageFile(self)
+        super().paintEvent(e)
+
 
 class WebImage(QLabel):
     downloadFinishedSignal = pyqtSignal(bool)
 
+    LAZY_LOAD_MARGIN = 1.0
+
     @functools.singledispatchmethod
     def __init__(self, parent=None):
         """
@@ -39,7 +684,14 @@ class WebImage(QLabel):
         self.setFixedSize(48, 48)
         self.setScaledContents(True)
         self.loading = False
+        self._lazyLoad = True
+        self._requested = False
+        self._decodePath = None
+        self._imagePath = None
+        self._imageSize = QSize()
+        self._refreshTimer = None
         self.downloadFinishedSignal.connect(self.downloadFinished)
+        self.destroyed.connect(lambda _=None, wid=id(self): imageLoader.cancel(wid))
 
     @__init__.register
     def _(self, img: str | FluentIconBase, url: str = None, parent=None, thread_pool: ThreadPoolExecutor = None):
@@ -48,7 +700,7 @@ class WebImage(QLabel):
         :param img: 路径
         :param url: 链接
         :param parent:
-        :param thread_pool: 线程池
+        :param thread_pool: 已弃用，下载由内置的imageLoader调度
         """
         self.__init__(parent)
         if img:
@@ -68,21 +720,39 @@ class WebImage(QLabel):
         设置图片
         :param img: 路径
         :param url: 链接
-        :param thread_pool: 下载线程池
+        :param thread_pool: 已弃用，下载由内置的imageLoader调度
         """
         if url:
             self.loading = True
+            _clearImageFile(self)
             self.path = img
             self.url = url
 
-            thread_pool.submit(self.download)
+            self._requested = False
+            self._updateLoad()
         else:
             self.loading = False
+            self._requested = False
             if isinstance(img, str):
-                self.setPixmap(QPixmap(img))
+                _setImageFile(self, img)
             elif isinstance(img, FluentIconBase):
+                _clearImageFile(self)
                 self.setPixmap(toQIcon(img).pixmap(QSize(100, 100)))
 
+    def _onImageDecoded(self, path: str, pixmap: QPixmap):
+        if self._decodePath != path:
+            return
+        self._decodePath = None
+        self.setPixmap(_scaledPixmap(self, pixmap))
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        _refreshImageFile(self)
+
+    def paintEvent(self, e):
+        _refreshImageFile(self)
+        super().paintEvent(e)
+
     def downloadFinished(self, msg):
         if not self.loading:
             return
@@ -90,8 +760,71 @@ class WebImage(QLabel):
             self.setImg(self.path)
 
     def download(self):
-        if zb.existPath(self.path):
-            self.downloadFinishedSignal.emit(True)
+        imageLoader.request(self, self.url, self.path)
+        self._requested = True
+
+    def setLazyLoad(self, lazy: bool):
+        """
+        设置是否延迟加载，开启后仅在组件可见且位于滚动区域视口附近时才开始下载，滚出范围时取消未完成的下载
+        :param lazy: 是否延迟加载
+        """
+        self._lazyLoad = lazy
+        if self.loading:
+            self._updateLoad()
+
+    def isLazyLoad(self):
+        """
+        是否延迟加载
+        :return: 是否
+        """
+        return self._lazyLoad
+
+    def _scrollArea(self):
+        parent = self.parentWidget()
+        while parent is not None:
+            if isinstance(parent, QAbstractScrollArea):
+                return parent
+            parent = parent.parentWidget()
+        return None
+
+    def _isNearViewport(self, area: QAbstractScrollArea):
+        viewport = area.viewport()
+        if not viewport.isAncestorOf(self):
+            return True
+        margin_w = int(viewport.width() * self.LAZY_LOAD_MARGIN)
+        margin_h = int(viewport.height() * self.LAZY_LOAD_MARGIN)
+        rect = QRect(self.mapTo(viewport, QPoint(0, 0)), self.size())
+        return rect.intersects(viewport.rect().adjusted(-margin_w, -margin_h, margin_w, margin_h))
+
+    def _updateLoad(self):
+        if not self.loading:
             return
-        msg = zb.singleDownload(self.url, self.path, False, True, zb.REQUEST_HEADER)
-        self.downloadFinishedSignal.emit(bool(msg))
+        if not self._lazyLoad:
+            if not self._requested:
+                self.download()
+            return
+        if not self.isVisible():
+            return
+
+        area = self._scrollArea()
+        if area is not None:
+            _ViewportWatcher.watch(area, self)
+        near = area is None or self._isNearViewport(area)
+        if near and not self._requested:
+            imageLoader.request(self, self.url, self.path, ImageLoader.VISIBLE_PRIORITY)
+            self._requested = True
+        elif near:
+            imageLoader.setPriority(self, ImageLoader.VISIBLE_PRIORITY)
+        elif self._requested:
+            imageLoader.cancel(self)
+            self._requested = False
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        if self.loading:
+            self._updateLoad()
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        if self.loading and self._requested:
+            imageLoader.setPriority(self, ImageLoader.HIDDEN_PRIORITY)
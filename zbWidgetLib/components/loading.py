@@ -3,7 +3,55 @@ from .card import DisplayCard
 from .progress import CustomProgressRing
 
 
-class LoadingCard(DisplayCard):
+class LoadingTrackerBase:
+    """
+    为含有progressRing和setText的加载组件提供聚合进度模型绑定
+    """
+    _tracker = None
+    _trackerText = ""
+    _trackerRestore = None
+
+    def setTracker(self, tracker, text: str = "加载中..."):
+        """
+        绑定聚合进度模型，按模型的刷新频率更新进度环和文本，解除绑定时恢复绑定前的进度环状态和文本
+        :param tracker: ProgressTracker，为None时解除绑定
+        :param text: 进度文本前缀
+        """
+        if self._tracker is not None:
+            self._tracker.progressChanged.disconnect(self._onTrackerProgress)
+            self._tracker.textChanged.disconnect(self._onTrackerText)
+        elif tracker is not None:
+            self._trackerRestore = (self.progressRing.isIndeterminate(), self.progressRing.getVal(), self.getText())
+        self._tracker = tracker
+        self._trackerText = text
+        if tracker is not None:
+            self.progressRing.setIndeterminate(False)
+            tracker.progressChanged.connect(self._onTrackerProgress)
+            tracker.textChanged.connect(self._onTrackerText)
+            self._onTrackerProgress(tracker.getProgress())
+            self._onTrackerText(tracker.getText())
+        elif self._trackerRestore is not None:
+            indeterminate, val, text = self._trackerRestore
+            self._trackerRestore = None
+            self.progressRing.setVal(val)
+            self.progressRing.setIndeterminate(indeterminate)
+            self.setText(text)
+
+    def getTracker(self):
+        """
+        获取绑定的聚合进度模型
+        :return: ProgressTracker
+        """
+        return self._tracker
+
+    def _onTrackerProgress(self, progress: float):
+        self.progressRing.setVal(int(progress))
+
+    def _onTrackerText(self, text: str):
+        self.setText(f"{self._trackerText} {text}".strip())
+
+
+class LoadingCard(DisplayCard, LoadingTrackerBase):
 
     def __init__(self, parent=None, indeterminate: bool = True):
         """
@@ -17,6 +65,13 @@ class LoadingCard(DisplayCard):
     def setVal(self, val: int):
         self.progressRing.setVal(val)
 
+    def postVal(self, val: int):
+        """
+        线程安全地提交进度值，高频调用会被合并
+        :param val: 进度值
+        """
+        self.progressRing.postVal(val)
+
     def setValue(self, val: int):
         self.setVal(val)
 
@@ -33,7 +88,7 @@ class LoadingCard(DisplayCard):
         return self.getVal()
 
 
-class LoadingMessageBox(MaskDialogBase):
+class LoadingMessageBox(MaskDialogBase, LoadingTrackerBase):
     def __init__(self, parent=None, indeterminate: bool = True):
         super().__init__(parent=parent)
 
@@ -61,6 +116,13 @@ class LoadingMessageBox(MaskDialogBase):
     def setVal(self, val: int):
         self.progressRing.setVal(val)
 
+    def postVal(self, val: int):
+        """
+        线程安全地提交进度值，高频调用会被合并
+        :param val: 进度值
+        """
+        self.progressRing.postVal(val)
+
     def setValue(self, val: int):
         self.setVal(val)
 
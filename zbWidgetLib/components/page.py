@@ -1,4 +1,5 @@
 from ..base import *
+from collections import OrderedDict
 
 
 class BetterScrollArea(SmoothScrollArea):
@@ -97,6 +98,200 @@ class PageInfoBase:
         return self.getIcon()
 
 
+class _PagePreloader(QObject):
+
+    def __init__(self):
+        """
+        在空闲时依次构建预加载的页面，每次只构建一个
+        """
+        super().__init__()
+        self._queue = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._loadNext)
+
+    def add(self, page, delay: int):
+        if page not in self._queue:
+            self._queue.append(page)
+        if not self._timer.isActive():
+            self._timer.start(delay)
+
+    def remove(self, page):
+        if page in self._queue:
+            self._queue.remove(page)
+
+    def _loadNext(self):
+        while self._queue:
+            page = self._queue.pop(0)
+            try:
+                if page.isLoaded():
+                    continue
+                # 容器已被删除时在此抛出RuntimeError，避免构建出无父组件的页面
+                page.objectName()
+                page.load()
+            except RuntimeError:
+                continue
+            break
+        if self._queue:
+            self._timer.start(LazyPage.PRELOAD_INTERVAL)
+
+
+_preloader = None
+
+
+class _LazyPageCache:
+
+    def __init__(self):
+        """
+        按最近使用顺序记录已构建的LazyPage，超出数量上限时卸载最久未使用的页面
+        """
+        self.maxCount = 0
+        self._recent = OrderedDict()
+
+    def touch(self, key, page, current=None):
+        self._recent[key] = page
+        self._recent.move_to_end(key)
+        self.evict(key, current)
+
+    def discard(self, key):
+        self._recent.pop(key, None)
+
+    def evict(self, *keep):
+        if self.maxCount <= 0:
+            return
+        loaded = [key for key, page in self._recent.items() if page.isLoaded()]
+        excess = len(loaded) - self.maxCount
+        for key in loaded:
+            if excess <= 0:
+                break
+            if key not in keep:
+                self._recent[key].unload()
+                excess -= 1
+
+
+class LazyPage(QWidget):
+    """
+    延迟构建的页面容器，第一次显示时才调用工厂函数创建页面，可卸载页面并在再次显示时重新创建
+    """
+    PRELOAD_INTERVAL = 50
+    pageLoaded = pyqtSignal(object)
+    pageUnloaded = pyqtSignal()
+
+    def __init__(self, factory, parent=None, name: str = None):
+        """
+        :param factory: 创建页面的函数，无参数，返回页面组件
+        :param parent: 父组件
+        :param name: 页面名称，同时作为objectName
+        """
+        super().__init__(parent=parent)
+        self._factory = factory
+        self._page = None
+        self._state = None
+        if name:
+            self.setObjectName(name)
+
+        self.vBoxLayout = QVBoxLayout(self)
+        self.vBoxLayout.setContentsMargins(0, 0, 0, 0)
+        self.vBoxLayout.setSpacing(0)
+
+    def load(self):
+        """
+        立即构建页面
+        :return: 页面组件
+        """
+        if self._page is None:
+            self.cancelPreload()
+            self._page = self._factory()
+            self._page.setParent(self)
+            self.vBoxLayout.addWidget(self._page)
+            if self._state is not None:
+                self._restoreState(self._page, self._state)
+                self._state = None
+            self.pageLoaded.emit(self._page)
+        return self._page
+
+    def unload(self):
+        """
+        销毁页面以释放内存，保存滚动位置和页面saveState()的返回值，再次显示时重新创建页面并通过restoreState()恢复
+        :return: 是否卸载
+        """
+        if self._page is None:
+            return False
+        page = self._page
+        self._state = self._saveState(page)
+        self._page = None
+        self.vBoxLayout.removeWidget(page)
+        page.hide()
+        page.deleteLater()
+        self.pageUnloaded.emit()
+        return True
+
+    def _saveState(self, page):
+        state = {}
+        if isinstance(page, QAbstractScrollArea):
+            state["scroll"] = (page.horizontalScrollBar().value(), page.verticalScrollBar().value())
+        if callable(getattr(page, "saveState", None)):
+            state["page"] = page.saveState()
+        return state
+
+    def _restoreState(self, page, state: dict):
+        if "page" in state and callable(getattr(page, "restoreState", None)):
+            page.restoreState(state["page"])
+        if "scroll" in state:
+            QTimer.singleShot(0, lambda: self._restoreScroll(page, *state["scroll"]))
+
+    def _restoreScroll(self, page, x: int, y: int):
+        try:
+            page.horizontalScrollBar().setValue(x)
+            page.verticalScrollBar().setValue(y)
+        except RuntimeError:
+            pass
+
+    def preload(self, delay: int = 0):
+        """
+        在空闲时预先构建页面
+        :param delay: 开始构建前的延迟（毫秒）
+        """
+        global _preloader
+        if self._page is not None:
+            return
+        if _preloader is None:
+            _preloader = _PagePreloader()
+        _preloader.add(self, max(delay, 0))
+
+    def cancelPreload(self):
+        """
+        取消尚未执行的预加载
+        """
+        if _preloader is not None:
+            _preloader.remove(self)
+
+    def isLoaded(self):
+        """
+        页面是否已构建
+        :return: 是否
+        """
+        return self._page is not None
+
+    def getPage(self):
+        """
+        获取页面，未构建时为None
+        :return: 页面组件
+        """
+        return self._page
+
+    def getFactory(self):
+        """
+        获取创建页面的函数
+        :return: 函数
+        """
+        return self._factory
+
+    def showEvent(self, e):
+        self.load()
+        super().showEvent(e)
+
+
 class BasicEmptyPage(BetterScrollArea, PageInfoBase):
 
     def __init__(self, parent=None, title: str = None, subtitle: str = None, icon=None):
@@ -164,6 +359,7 @@ class BasicTabPage(BasicEmptyPage):
         super().__init__(parent=parent)
 
         self._pages = {}
+        self._pageCache = _LazyPageCache()
 
         self.vBoxLayout = QVBoxLayout(self)
         self.vBoxLayout.setContentsMargins(0, 0, 0, 0)
@@ -176,17 +372,25 @@ class BasicTabPage(BasicEmptyPage):
         self.vBoxLayout.addWidget(self.pivot, 0, Qt.AlignHCenter)
         self.vBoxLayout.addWidget(self.stackedWidget)
 
-    def addPage(self, widget, name: str = None, icon=None):
+    def addPage(self, widget, name: str = None, icon=None, preload: bool = False):
         """
         添加标签页
-        :param widget: 标签页对象
+        :param widget: 标签页对象，或创建标签页的函数（第一次切换到该页时才调用）
         :param name: 名称
         :param icon: 图标
+        :param preload: 使用函数创建时，是否在空闲时预先构建
         """
+        if not isinstance(widget, QWidget) and not name:
+            raise NameError("使用函数创建页面时必须指定页面名称!")
         if not name:
             name = widget.objectName()
         if name in self._pages.keys():
             raise NameError(f"页面名称{name}已存在，请替换为其他名称!")
+        if not isinstance(widget, QWidget):
+            widget = LazyPage(widget, self, name)
+            widget.pageLoaded.connect(lambda _, widget=widget: self._onLazyPageLoaded(widget))
+            if preload:
+                widget.preload()
         self.stackedWidget.addWidget(widget)
         self.pivot.addItem(name, name, lambda: self.stackedWidget.setCurrentWidget(widget), icon)
         self._pages[name] = widget
@@ -203,7 +407,7 @@ class BasicTabPage(BasicEmptyPage):
         """
         获取指定页面
         :param name: 页面id
-        :return: 页面对象
+        :return: 页面对象，使用函数创建的页面为LazyPage
         """
         return self._pages.get(name)
 
@@ -238,6 +442,9 @@ class BasicTabPage(BasicEmptyPage):
         if name not in self._pages.keys():
             return False
         widget = self._pages.pop(name)
+        self._pageCache.discard(name)
+        if isinstance(widget, LazyPage):
+            widget.cancelPreload()
         widget.hide()
         self.stackedWidget.removeWidget(widget)
         self.pivot.removeWidget(name)
@@ -251,10 +458,31 @@ class BasicTabPage(BasicEmptyPage):
         """
         self.removePage(name)
 
+    def setMaxLoadedPages(self, count: int):
+        """
+        设置同时保留的由函数创建的页面数量，超出时卸载最久未访问的页面，再次访问时重新创建并恢复状态
+        :param count: 页面数量，0表示不限制
+        """
+        self._pageCache.maxCount = max(0, count)
+        self._pageCache.evict(self.stackedWidget.currentWidget().objectName() if self.stackedWidget.currentWidget() else None)
+
+    def getMaxLoadedPages(self):
+        """
+        获取同时保留的由函数创建的页面数量
+        :return: 页面数量，0表示不限制
+        """
+        return self._pageCache.maxCount
+
     def onCurrentIndexChanged(self, index: int):
         widget = self.stackedWidget.widget(index)
         if widget:
             self.pivot.setCurrentItem(widget.objectName())
+            if isinstance(widget, LazyPage):
+                self._pageCache.touch(widget.objectName(), widget)
+
+    def _onLazyPageLoaded(self, widget):
+        current = self.stackedWidget.currentWidget()
+        self._pageCache.touch(widget.objectName(), widget, current.objectName() if current else None)
 
 
 class BasicTab(BasicEmptyPage):
@@ -276,6 +504,7 @@ class ChangeableTab(BasicTab):
     def __init__(self, parent=None):
         super().__init__(parent=parent)
         self._pages = {}
+        self._pageCache = _LazyPageCache()
         self.on_show_page = None
         self.on_show_wid = None
 
@@ -287,13 +516,17 @@ class ChangeableTab(BasicTab):
         """
         添加页面
         :param alignment: 对其方式
-        :param widget: 组件
+        :param widget: 组件，或创建组件的函数（第一次展示时才调用）
         :param wid: 页面id
         """
+        if not isinstance(widget, QWidget):
+            widget = LazyPage(widget, self)
         widget.setParent(self)
         widget.hide()
         if not wid:
             wid = hex(id(widget))
+        if isinstance(widget, LazyPage):
+            widget.pageLoaded.connect(lambda _, wid=wid, widget=widget: self._pageCache.touch(wid, widget, self.on_show_wid))
         self._pages[wid] = widget
         if alignment:
             self.vBoxLayout.addWidget(widget, 0, alignment)
@@ -309,6 +542,8 @@ class ChangeableTab(BasicTab):
         self.getPage(wid).show()
         self.on_show_page = self.getPage(wid)
         self.on_show_wid = wid
+        if isinstance(self.on_show_page, LazyPage):
+            self._pageCache.touch(wid, self.on_show_page)
 
     def setPage(self, wid: str | int):
         """
@@ -333,10 +568,31 @@ class ChangeableTab(BasicTab):
         if wid not in self._pages.keys():
             return False
         widget = self._pages.pop(wid)
+        self._pageCache.discard(wid)
+        if isinstance(widget, LazyPage):
+            widget.cancelPreload()
+        if widget is self.on_show_page:
+            self.on_show_page = None
+            self.on_show_wid = None
         widget.hide()
         self.vBoxLayout.removeWidget(widget)
         widget.deleteLater()
 
+    def setMaxLoadedPages(self, count: int):
+        """
+        设置同时保留的由函数创建的页面数量，超出时卸载最久未展示的页面，再次展示时重新创建并恢复状态
+        :param count: 页面数量，0表示不限制
+        """
+        self._pageCache.maxCount = max(0, count)
+        self._pageCache.evict(self.on_show_wid)
+
+    def getMaxLoadedPages(self):
+        """
+        获取同时保留的由函数创建的页面数量
+        :return: 页面数量，0表示不限制
+        """
+        return self._pageCache.maxCount
+
     def getPage(self, wid: str | int):
         """
         获取指定页面
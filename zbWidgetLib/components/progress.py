@@ -1,11 +1,504 @@
 from ..base import *
+from collections import OrderedDict
+import asyncio
+import inspect
+import threading
+import time
+import weakref
 
 
-class CustomProgressRing(QProgressBar):
+class _AnimationClock(QObject):
+    """共享动画时钟。
+
+    以固定帧率统一驱动所有正在播放不确定动画的进度组件，组件根据经过的时间计算动画相位，
+    同一帧内的重绘请求由 Qt 合并处理。已注册的组件全部不可见时降低到空闲频率，只检查可见性。
+    """
+    INTERVAL = 16
+    IDLE_INTERVAL = 250
+
+    def __init__(self):
+        super().__init__()
+        self._widgets = weakref.WeakKeyDictionary()
+        self._elapsed = QElapsedTimer()
+        self._elapsed.start()
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(self.INTERVAL)
+        self._timer.timeout.connect(self._tick)
+
+    def now(self):
+        """返回时钟启动后经过的毫秒数。"""
+        return self._elapsed.elapsed()
+
+    def register(self, widget):
+        """开始驱动组件。"""
+        self._widgets[widget] = None
+        if self._timer.interval() != self.INTERVAL:
+            self._timer.setInterval(self.INTERVAL)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def unregister(self, widget):
+        """停止驱动组件。"""
+        self._widgets.pop(widget, None)
+        if not self._widgets:
+            self._timer.stop()
+
+    def isRegistered(self, widget):
+        return widget in self._widgets
+
+    def count(self):
+        """返回正在驱动的组件数量。"""
+        return len(self._widgets)
+
+    def _tick(self):
+        now = self.now()
+        visible = 0
+        for widget in list(self._widgets.keys()):
+            try:
+                if widget._onClockTick(now):
+                    visible += 1
+            except RuntimeError:
+                self._widgets.pop(widget, None)
+        if not self._widgets:
+            self._timer.stop()
+            return
+        interval = self.INTERVAL if visible else self.IDLE_INTERVAL
+        if self._timer.interval() != interval:
+            self._timer.setInterval(interval)
+
+
+_clock = None
+
+
+def _animationClock():
+    global _clock
+    if _clock is None:
+        _clock = _AnimationClock()
+    return _clock
+
+
+class ProgressSink(QObject):
+    """线程安全的进度接收器。
+
+    可以在任意线程中高频调用 post，接收器只保留最新的值，并在 GUI 线程中以不超过设定帧率的频率交给目标函数。
+    """
+    _postedSignal = pyqtSignal()
+
+    def __init__(self, target, fps: int = 60, parent=None):
+        """
+        :param target: 接收最新值的函数，在 GUI 线程中调用
+        :param fps: 每秒最多调用目标函数的次数，0 表示不限制（仍会合并同一轮事件循环内的更新）
+        :param parent: 父对象
+        """
+        super().__init__(parent)
+        self._target = target
+        self._fps = max(0, fps)
+        self._lock = threading.Lock()
+        self._value = None
+        self._pending = False
+        self._scheduled = False
+        self._lastApplied = 0.0
+        self._timer = None
+        self._postedSignal.connect(self._schedule)
+
+    def post(self, value):
+        """提交新的值，可在任意线程中调用。"""
+        with self._lock:
+            self._value = value
+            self._pending = True
+            if self._scheduled:
+                return
+            self._scheduled = True
+        try:
+            self._postedSignal.emit()
+        except RuntimeError:
+            pass
+
+    def _schedule(self):
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self.flush)
+        delay = 0
+        if self._fps > 0:
+            delay = 1000 / self._fps - (time.monotonic() - self._lastApplied) * 1000
+        self._timer.start(max(0, int(delay)))
+
+    def flush(self):
+        """立即把等待中的值交给目标函数。"""
+        with self._lock:
+            value = self._value
+            pending = self._pending
+            self._value = None
+            self._pending = False
+            self._scheduled = False
+        if self._timer is not None:
+            self._timer.stop()
+        if pending:
+            self._lastApplied = time.monotonic()
+            self._target(value)
+
+    def isPending(self):
+        """返回是否有等待应用的值。"""
+        return self._pending
+
+    def setFps(self, fps: int):
+        """设置每秒最多更新的次数，0 表示不限制。"""
+        self._fps = max(0, fps)
+
+    def getFps(self):
+        """返回每秒最多更新的次数。"""
+        return self._fps
+
+
+class ProgressTask:
+    """聚合进度中的一个子任务。
+
+    每个子任务应只由一个线程更新，更新只写入自身的属性，不需要加锁。
+    """
+
+    def __init__(self, tracker, name: str = "", total: float = 1, weight: float = 1):
+        """
+        :param tracker: 所属的 ProgressTracker
+        :param name: 任务名称
+        :param total: 总工作量，0 表示未知，完成前进度为 0
+        :param weight: 在总进度中所占的权重
+        """
+        self.name = name
+        self.total = total
+        self.weight = weight
+        self.done = 0
+        self.finished = False
+        self.failed = False
+        self._tracker = tracker
+
+    def advance(self, amount: float = 1):
+        """增加已完成的工作量。"""
+        self.done += amount
+        self._tracker._changed()
+
+    def setDone(self, done: float):
+        """设置已完成的工作量。"""
+        self.done = done
+        self._tracker._changed()
+
+    def setTotal(self, total: float):
+        """设置总工作量。"""
+        self.total = total
+        self._tracker._changed()
+
+    def finish(self):
+        """标记任务完成。"""
+        if self.total > 0:
+            self.done = self.total
+        self.finished = True
+        self._tracker._changed()
+
+    def fail(self):
+        """标记任务失败，失败的任务视为已结束。"""
+        self.failed = True
+        self.finished = True
+        self._tracker._changed()
+
+    def fraction(self):
+        """返回任务进度，范围 0 到 1。"""
+        if self.finished:
+            return 1.0
+        if self.total <= 0:
+            return 0.0
+        return min(1.0, max(0.0, self.done / self.total))
+
+
+def _formatTime(seconds: float):
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+class ProgressTracker(QObject):
+    """多任务聚合进度模型。
+
+    登记带权重的子任务（线程、线程池 Future 或 asyncio 任务），在 GUI 线程中以有限的频率汇总总进度、吞吐量和剩余时间，
+    并通过信号驱动进度条和文本。
+    """
+    progressChanged = pyqtSignal(float)
+    textChanged = pyqtSignal(str)
+    finished = pyqtSignal()
+    SAMPLE_WINDOW = 5.0
+
+    def __init__(self, parent=None, fps: int = 10):
+        """
+        :param parent: 父对象
+        :param fps: 每秒最多刷新的次数
+        """
+        super().__init__(parent)
+        self._tasks = []
+        self._lock = threading.Lock()
+        self._samples = []
+        self._progress = 0.0
+        self._finishedEmitted = False
+        self._sink = ProgressSink(self._refresh, fps, self)
+
+    def _changed(self):
+        self._sink.post(None)
+
+    def addTask(self, name: str = "", total: float = 1, weight: float = 1):
+        """
+        登记子任务，可在任意线程中调用
+        :param name: 任务名称
+        :param total: 总工作量，0 表示未知
+        :param weight: 在总进度中所占的权重
+        :return: ProgressTask
+        """
+        task = ProgressTask(self, name, total, weight)
+        with self._lock:
+            self._tasks.append(task)
+            self._finishedEmitted = False
+        self._changed()
+        return task
+
+    def track(self, future, name: str = "", weight: float = 1):
+        """
+        登记一个 concurrent.futures.Future、asyncio.Future/Task 或协程，完成时自动结束对应的子任务；
+        协程需在运行中的事件循环内登记
+        :param future: Future、Task 或协程
+        :param name: 任务名称
+        :param weight: 在总进度中所占的权重
+        :return: ProgressTask
+        """
+        if inspect.iscoroutine(future):
+            future = asyncio.ensure_future(future)
+        task = self.addTask(name, 1, weight)
+
+        def done(f):
+            if f.cancelled() or f.exception() is not None:
+                task.fail()
+            else:
+                task.finish()
+
+        future.add_done_callback(done)
+        return task
+
+    def reset(self):
+        """清空所有子任务。"""
+        with self._lock:
+            self._tasks = []
+            self._samples = []
+            self._finishedEmitted = False
+        self._progress = 0.0
+        self._sink.post(None)
+
+    def tasks(self):
+        """返回子任务列表的副本。"""
+        with self._lock:
+            return list(self._tasks)
+
+    def count(self):
+        """返回子任务数量。"""
+        return len(self._tasks)
+
+    def finishedCount(self):
+        """返回已结束的子任务数量。"""
+        return sum(1 for task in self.tasks() if task.finished)
+
+    def failedCount(self):
+        """返回失败的子任务数量。"""
+        return sum(1 for task in self.tasks() if task.failed)
+
+    def isFinished(self):
+        """返回是否所有子任务都已结束。"""
+        tasks = self.tasks()
+        return bool(tasks) and all(task.finished for task in tasks)
+
+    def getProgress(self):
+        """返回最近一次刷新时的总进度百分比。"""
+        return self._progress
+
+    def getThroughput(self):
+        """返回最近一段时间内每秒完成的工作量（各子任务 done 之和）。"""
+        if len(self._samples) < 2:
+            return 0.0
+        (t0, _, d0), (t1, _, d1) = self._samples[0], self._samples[-1]
+        return (d1 - d0) / (t1 - t0) if t1 > t0 else 0.0
+
+    def getEta(self):
+        """返回按最近一段时间的速度估算的剩余秒数，无法估算时为 None。"""
+        if len(self._samples) < 2:
+            return None
+        (t0, p0, _), (t1, p1, _) = self._samples[0], self._samples[-1]
+        if t1 <= t0 or p1 <= p0:
+            return None
+        return (100 - p1) / ((p1 - p0) / (t1 - t0))
+
+    def getText(self):
+        """返回“已结束/总数 百分比 剩余时间”格式的进度文本。"""
+        text = f"{self.finishedCount()}/{self.count()} {self._progress:.0f}%"
+        eta = self.getEta()
+        if eta is not None and not self.isFinished():
+            text += f" 剩余 {_formatTime(eta)}"
+        return text
+
+    def setFps(self, fps: int):
+        """设置每秒最多刷新的次数。"""
+        self._sink.setFps(fps)
+
+    def getFps(self):
+        """返回每秒最多刷新的次数。"""
+        return self._sink.getFps()
+
+    def _refresh(self, value=None):
+        tasks = self.tasks()
+        total_weight = sum(task.weight for task in tasks)
+        if total_weight > 0:
+            progress = sum(task.weight * task.fraction() for task in tasks) / total_weight * 100
+        else:
+            progress = 0.0
+        done = sum(task.done for task in tasks)
+
+        now = time.monotonic()
+        self._samples.append((now, progress, done))
+        while len(self._samples) > 2 and now - self._samples[0][0] > self.SAMPLE_WINDOW:
+            self._samples.pop(0)
+
+        self._progress = progress
+        self.progressChanged.emit(progress)
+        self.textChanged.emit(self.getText())
+        if tasks and all(task.finished for task in tasks) and not self._finishedEmitted:
+            self._finishedEmitted = True
+            self.finished.emit()
+
+
+class _SpriteCache:
+    """不确定动画帧缓存，外观相同的圆环共享同一组预渲染帧，按帧的字节数淘汰最久未使用的帧组。"""
+    MAX_BYTES = 16 * 1024 * 1024
+
+    def __init__(self):
+        self._strips = OrderedDict()
+        self._costs = {}
+        self._size = 0
+
+    def strip(self, key, count: int):
+        """返回 key 对应的帧列表，未渲染的帧为 None。"""
+        frames = self._strips.get(key)
+        if frames is None:
+            frames = [None] * count
+            self._strips[key] = frames
+            self._costs[key] = 0
+        else:
+            self._strips.move_to_end(key)
+        return frames
+
+    def insert(self, key, index: int, frame: QPixmap):
+        """缓存一帧，超出预算时先淘汰其他帧组，单个帧组已占满预算时不再缓存新帧。"""
+        frames = self._strips.get(key)
+        if frames is None:
+            return
+        cost = frame.width() * frame.height() * 4
+        while self._size + cost > self.MAX_BYTES and len(self._strips) > 1:
+            old = next(iter(self._strips))
+            if old == key:
+                self._strips.move_to_end(key)
+                continue
+            del self._strips[old]
+            self._size -= self._costs.pop(old)
+        if self._size + cost > self.MAX_BYTES:
+            return
+        frames[index] = frame
+        self._costs[key] += cost
+        self._size += cost
+
+    def clear(self):
+        self._strips.clear()
+        self._costs.clear()
+        self._size = 0
+
+
+_spriteCache = _SpriteCache()
+
+
+class _ClockAnimationBase:
+    """由共享动画时钟驱动不确定动画的组件基类。
+
+    组件隐藏时从时钟注销，显示时重新注册；所在窗口最小化或被父组件完全裁剪（例如滚出视口）时跳过更新。
+    子类需要提供 _resetIndeterminatePhase() 和 _setIndeterminatePhase(elapsed)，后者按动画开始后经过的毫秒数设置相位。
+    """
+    _aniRunning = False
+    _aniStart = 0
+    _aniElapsed = 0
+    _aniPausedAt = None
+
+    def _isAnimationVisible(self):
+        """返回组件当前是否能被看到。"""
+        if not self.isVisible() or self.window().isMinimized():
+            return False
+        return not self.visibleRegion().isEmpty()
+
+    def _updateClockRegistration(self):
+        clock = _animationClock()
+        try:
+            if self._aniRunning and self.isVisible():
+                clock.register(self)
+            else:
+                clock.unregister(self)
+        except RuntimeError:
+            pass
+
+    def _onClockTick(self, now: int):
+        if not self._isAnimationVisible():
+            return False
+        self._aniElapsed = now - self._aniStart
+        self._setIndeterminatePhase(self._aniElapsed)
+        self.update()
+        return True
+
+    def isIndeterminateAnimationRunning(self):
+        """返回不确定动画是否正在播放。"""
+        return self._aniRunning
+
+    def startIndeterminateAnimation(self):
+        """启动不确定模式动画。"""
+        if self._aniRunning:
+            return
+        self._aniRunning = True
+        self._aniPausedAt = None
+        self._aniElapsed = 0
+        self._resetIndeterminatePhase()
+        self._aniStart = _animationClock().now()
+        self._updateClockRegistration()
+
+    def stopIndeterminateAnimation(self):
+        """停止不确定模式动画。"""
+        self._aniRunning = False
+        self._aniPausedAt = None
+        self._aniElapsed = 0
+        self._updateClockRegistration()
+        self._resetIndeterminatePhase()
+        self.update()
+
+    def _pauseIndeterminateAnimation(self):
+        if self._aniRunning:
+            self._aniRunning = False
+            self._aniPausedAt = _animationClock().now() - self._aniStart
+            self._updateClockRegistration()
+
+    def _resumeIndeterminateAnimation(self):
+        if self._aniPausedAt is None:
+            self.startIndeterminateAnimation()
+            return
+        self._aniStart = _animationClock().now() - self._aniPausedAt
+        self._aniPausedAt = None
+        self._aniRunning = True
+        self._updateClockRegistration()
+
+
+class CustomProgressRing(QProgressBar, _ClockAnimationBase):
     """环形进度条。
 
     支持确定和不确定（转圈）两种模式，包含值动画与不确定动画控制。
     """
+    SPRITE_INTERVAL = 16
 
     def __init__(self, parent=None, useAni=True, indeterminate=False,
                  drawBackground=True, duration=1000, size=80, strokeWidth=6):
@@ -35,9 +528,8 @@ class CustomProgressRing(QProgressBar):
         self._darkBarColor = QColor()
 
         # 动画属性
-        self._animStartAngle = -180
+        self._animStartAngle = 0
         self._spanAngle = 0
-        self._animationGroup = None
 
         # 值动画
         self._val = 0
@@ -46,53 +538,38 @@ class CustomProgressRing(QProgressBar):
         self._valueAnimation.setDuration(150)
         self._valueAnimation.setEasingCurve(QEasingCurve.OutQuad)
 
-        self._initAnimations()
-
         setFont(self)
         self.setFixedSize(size, size)
         self.setTextVisible(False)
 
+        self._paintCacheDirty = True
+        self._useSprite = False
+        qconfig.themeChanged.connect(self._invalidatePaintCache)
+        qconfig.themeColorChanged.connect(self._invalidatePaintCache)
+
+        self._progressSink = ProgressSink(self.setVal, parent=self)
+
         self.valueChanged.connect(self._onValueChanged)
 
         if indeterminate and useAni:
             self.startIndeterminateAnimation()
 
-    def _initAnimations(self):
-        """初始化动画组。"""
-        self.startAngleAni1 = QPropertyAnimation(self, b'animStartAngle', self)
-        self.startAngleAni2 = QPropertyAnimation(self, b'animStartAngle', self)
-        self.spanAngleAni1 = QPropertyAnimation(self, b'spanAngle', self)
-        self.spanAngleAni2 = QPropertyAnimation(self, b'spanAngle', self)
-
-        self.startAngleAniGroup = QSequentialAnimationGroup(self)
-        self.spanAngleAniGroup = QSequentialAnimationGroup(self)
-
-        self.startAngleAni1.setDuration(self._duration)
-        self.startAngleAni1.setStartValue(0)
-        self.startAngleAni1.setEndValue(450)
-
-        self.startAngleAni2.setDuration(self._duration)
-        self.startAngleAni2.setStartValue(450)
-        self.startAngleAni2.setEndValue(1080)
-
-        self.startAngleAniGroup.addAnimation(self.startAngleAni1)
-        self.startAngleAniGroup.addAnimation(self.startAngleAni2)
-
-        self.spanAngleAni1.setDuration(self._duration)
-        self.spanAngleAni1.setStartValue(0)
-        self.spanAngleAni1.setEndValue(180)
-
-        self.spanAngleAni2.setDuration(self._duration)
-        self.spanAngleAni2.setStartValue(180)
-        self.spanAngleAni2.setEndValue(0)
-
-        self.spanAngleAniGroup.addAnimation(self.spanAngleAni1)
-        self.spanAngleAniGroup.addAnimation(self.spanAngleAni2)
+    def _resetIndeterminatePhase(self):
+        self._animStartAngle = 0
+        self._spanAngle = 0
 
-        self._animationGroup = QParallelAnimationGroup(self)
-        self._animationGroup.addAnimation(self.startAngleAniGroup)
-        self._animationGroup.addAnimation(self.spanAngleAniGroup)
-        self._animationGroup.setLoopCount(-1)
+    def _setIndeterminatePhase(self, elapsed: int):
+        """根据经过的时间计算转圈动画的起始角度和跨度。"""
+        duration = max(1, self._duration)
+        t = elapsed % (2 * duration)
+        if t < duration:
+            progress = t / duration
+            self._animStartAngle = int(450 * progress)
+            self._spanAngle = int(180 * progress)
+        else:
+            progress = (t - duration) / duration
+            self._animStartAngle = int(450 + 630 * progress)
+            self._spanAngle = int(180 * (1 - progress))
 
     def getVal(self):
         """返回内部动画值。"""
@@ -104,6 +581,18 @@ class CustomProgressRing(QProgressBar):
         self.setValue(v)
         self.update()
 
+    def postVal(self, v: float):
+        """线程安全地提交进度值，高频调用会被合并，按帧率上限更新界面。"""
+        self._progressSink.post(v)
+
+    def setMaxFps(self, fps: int):
+        """设置 postVal 每秒最多更新界面的次数，0 表示不限制。"""
+        self._progressSink.setFps(fps)
+
+    def getMaxFps(self):
+        """返回 postVal 每秒最多更新界面的次数。"""
+        return self._progressSink.getFps()
+
     def _onValueChanged(self, value):
         """处理 valueChanged 信号。"""
         if not self._indeterminate and self._useAni:
@@ -132,6 +621,20 @@ class CustomProgressRing(QProgressBar):
         """返回是否启用值动画。"""
         return self._useAni
 
+    def setUseSprite(self, use_sprite: bool):
+        """启用或禁用预渲染帧模式。
+
+        启用后不确定动画的每一帧只渲染一次，由尺寸、线宽、颜色和缩放比例相同的圆环共享，绘制时只复制图像。
+        所有圆环的帧缓存共用 16MB 预算，超出后淘汰最久未使用的帧组。
+        """
+        if self._useSprite != use_sprite:
+            self._useSprite = use_sprite
+            self.update()
+
+    def isUseSprite(self):
+        """返回是否启用预渲染帧模式。"""
+        return self._useSprite
+
     @Property(float)
     def val(self):
         return self._val
@@ -202,21 +705,17 @@ class CustomProgressRing(QProgressBar):
             self._drawBackground = draw
             self.lightBackgroundColor = QColor(0, 0, 0, 34 if draw else 0)
             self.darkBackgroundColor = QColor(255, 255, 255, 34 if draw else 0)
-            self.update()
+            self._invalidatePaintCache()
 
     def getDuration(self):
         """返回动画时长（毫秒）。"""
         return self._duration
 
     def setDuration(self, duration: int):
-        """设置动画时长并更新相关动画。"""
+        """设置动画时长。"""
         if self._duration != duration:
             self._duration = duration
-            if hasattr(self, 'startAngleAni1'):
-                self.startAngleAni1.setDuration(duration)
-                self.startAngleAni2.setDuration(duration)
-                self.spanAngleAni1.setDuration(duration)
-                self.spanAngleAni2.setDuration(duration)
+            self._paintCacheDirty = True
 
     def getSize(self):
         return self._size
@@ -233,21 +732,7 @@ class CustomProgressRing(QProgressBar):
     def setStrokeWidth(self, width: int):
         if self._strokeWidth != width:
             self._strokeWidth = width
-            self.update()
-
-    def startIndeterminateAnimation(self):
-        """启动不确定模式动画。"""
-        if self._animationGroup and not self._animationGroup.state() == QPropertyAnimation.Running:
-            self._animStartAngle = 0
-            self._spanAngle = 0
-            self._animationGroup.start()
-
-    def stopIndeterminateAnimation(self):
-        """停止不确定模式动画。"""
-        if self._animationGroup:
-            self._animationGroup.stop()
-            self._animStartAngle = 0
-            self._spanAngle = 0
+            self._invalidatePaintCache()
 
     def barColor(self):
         """返回当前进度条颜色（考虑主题和自定义颜色）。"""
@@ -258,36 +743,95 @@ class CustomProgressRing(QProgressBar):
     def setCustomBarColor(self, light, dark):
         self._lightBarColor = QColor(light)
         self._darkBarColor = QColor(dark)
-        self.update()
+        self._invalidatePaintCache()
 
     def setCustomBackgroundColor(self, light, dark):
         self.lightBackgroundColor = QColor(light)
         self.darkBackgroundColor = QColor(dark)
+        self._invalidatePaintCache()
+
+    def _invalidatePaintCache(self, *args):
+        """标记几何尺寸、颜色和画笔需要重新计算。"""
+        self._paintCacheDirty = True
         self.update()
 
+    def _updatePaintCache(self):
+        """预先计算绘制区域和画笔，绘制时只进行弧线绘制。"""
+        cw = self._strokeWidth
+        w = min(self.height(), self.width()) - cw
+        self._paintRect = QRectF(cw / 2, self.height() / 2 - w / 2, w, w)
+
+        dark = isDarkTheme()
+        bc = self.darkBackgroundColor if dark else self.lightBackgroundColor
+        self._backgroundPen = QPen(bc, cw, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+        self._barPen = QPen(self.barColor(), cw, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+        self._textColor = QColor(Qt.white if dark else Qt.black)
+        self._spriteKey = (type(self), self.width(), self.height(), cw, self._duration, self._barPen.color().rgba(),
+                           bc.rgba() if self._drawBackground else None)
+        self._paintCacheDirty = False
+
+    def resizeEvent(self, e):
+        self._paintCacheDirty = True
+        super().resizeEvent(e)
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._updateClockRegistration()
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        self._updateClockRegistration()
+
+    def _spriteFrame(self):
+        """返回当前相位对应的预渲染帧，首次用到时才渲染。"""
+        dpr = self.devicePixelRatioF()
+        cycle = 2 * max(1, self._duration)
+        count = max(1, cycle // self.SPRITE_INTERVAL)
+        key = self._spriteKey + (dpr,)
+        frames = _spriteCache.strip(key, count)
+        index = int(self._aniElapsed % cycle * count / cycle)
+        frame = frames[index]
+        if frame is None:
+            frame = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            frame.setDevicePixelRatio(dpr)
+            frame.fill(Qt.transparent)
+            self._setIndeterminatePhase(index * cycle / count)
+            painter = QPainter(frame)
+            painter.setRenderHints(QPainter.Antialiasing)
+            self._drawRing(painter)
+            painter.end()
+            self._setIndeterminatePhase(self._aniElapsed)
+            _spriteCache.insert(key, index, frame)
+        return frame
+
     def _drawText(self, painter: QPainter, text: str):
         """在组件中央绘制文本。"""
         painter.setFont(self.font())
-        painter.setPen(Qt.white if isDarkTheme() else Qt.black)
+        painter.setPen(self._textColor)
         painter.drawText(self.rect(), Qt.AlignCenter, text)
 
     def paintEvent(self, e):
+        if self._paintCacheDirty:
+            self._updatePaintCache()
+
         painter = QPainter(self)
+        if self._indeterminate and self._useSprite:
+            painter.drawPixmap(0, 0, self._spriteFrame())
+            return
+
         painter.setRenderHints(QPainter.Antialiasing)
+        self._drawRing(painter)
 
-        cw = self._strokeWidth
-        w = min(self.height(), self.width()) - cw
-        rc = QRectF(cw / 2, self.height() / 2 - w / 2, w, w)
+    def _drawRing(self, painter: QPainter):
+        """使用当前相位或进度绘制圆环。"""
+        rc = self._paintRect
 
         if self._drawBackground:
-            bc = self.darkBackgroundColor if isDarkTheme() else self.lightBackgroundColor
-            pen = QPen(bc, cw, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-            painter.setPen(pen)
+            painter.setPen(self._backgroundPen)
             painter.drawArc(rc, 0, 360 * 16)
 
         if self._indeterminate:
-            pen = QPen(self.barColor(), cw, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-            painter.setPen(pen)
+            painter.setPen(self._barPen)
 
             start_angle = -self._animStartAngle + 180
             painter.drawArc(rc, (start_angle % 360) * 16, -self._spanAngle * 16)
@@ -305,8 +849,7 @@ class CustomProgressRing(QProgressBar):
                 degree = 0
 
             if degree > 0:
-                pen = QPen(self.barColor(), cw, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-                painter.setPen(pen)
+                painter.setPen(self._barPen)
 
                 start_angle = 90 * 16
                 span_angle = -degree * 16
@@ -364,44 +907,22 @@ class PartialProgressRing(CustomProgressRing):
         self._barStart = 0.0
         self._barSpan = 0.0
 
-        self._partialAnimationGroup = None
-        self._initPartialAnimations()
-
-        if indeterminate and useAni:
-            self.startIndeterminateAnimation()
-
-    def _initPartialAnimations(self):
-        """初始化部分环动画。"""
-        if self._partialAnimationGroup:
-            self._partialAnimationGroup.stop()
-
-        self.barStartAni = QPropertyAnimation(self, b"barStart", self)
-        self.barStartAni.setDuration(self._duration * 2)
-        self.barStartAni.setStartValue(0.0)
-        self.barStartAni.setEndValue(1.0)
+    def _resetIndeterminatePhase(self):
+        self._barStart = 0.0
+        self._barSpan = 0.0
 
+    def _setIndeterminatePhase(self, elapsed: int):
+        """根据经过的时间计算部分环的起始比例和跨度比例。"""
+        duration = max(1, self._duration)
         max_span = min(0.5, self._maxAngle / 360.0)
-
-        self.barSpanGrow = QPropertyAnimation(self, b"barSpan", self)
-        self.barSpanGrow.setDuration(self._duration)
-        self.barSpanGrow.setStartValue(0.0)
-        self.barSpanGrow.setEndValue(max_span)
-        self.barSpanGrow.setEasingCurve(QEasingCurve.OutQuad)
-
-        self.barSpanShrink = QPropertyAnimation(self, b"barSpan", self)
-        self.barSpanShrink.setDuration(self._duration)
-        self.barSpanShrink.setStartValue(max_span)
-        self.barSpanShrink.setEndValue(0.0)
-        self.barSpanShrink.setEasingCurve(QEasingCurve.InQuad)
-
-        spanGroup = QSequentialAnimationGroup(self)
-        spanGroup.addAnimation(self.barSpanGrow)
-        spanGroup.addAnimation(self.barSpanShrink)
-
-        self._partialAnimationGroup = QParallelAnimationGroup(self)
-        self._partialAnimationGroup.addAnimation(self.barStartAni)
-        self._partialAnimationGroup.addAnimation(spanGroup)
-        self._partialAnimationGroup.setLoopCount(-1)
+        t = elapsed % (2 * duration)
+        self._barStart = t / (2 * duration)
+        if t < duration:
+            progress = t / duration
+            self._barSpan = max_span * progress * (2 - progress)
+        else:
+            progress = (t - duration) / duration
+            self._barSpan = max_span * (1 - progress * progress)
 
     # Qt Property
     @Property(float)
@@ -429,34 +950,18 @@ class PartialProgressRing(CustomProgressRing):
 
     def setStartAngle(self, angle):
         self._startAngle = angle % 360
-        self.update()
+        self._invalidatePaintCache()
 
     def getMaxAngle(self):
         return self._maxAngle
 
     def setMaxAngle(self, angle):
         self._maxAngle = min(max(0, angle), 360)
-        self._initPartialAnimations()
-        if self._indeterminate:
-            self.startIndeterminateAnimation()
-        self.update()
+        self._invalidatePaintCache()
 
     startAngle = Property(int, getStartAngle, setStartAngle)
     maxAngle = Property(int, getMaxAngle, setMaxAngle)
 
-    def startIndeterminateAnimation(self):
-        if self._partialAnimationGroup:
-            self._barStart = 0.0
-            self._barSpan = 0.0
-            self._partialAnimationGroup.start()
-
-    def stopIndeterminateAnimation(self):
-        if self._partialAnimationGroup:
-            self._partialAnimationGroup.stop()
-            self._barStart = 0.0
-            self._barSpan = 0.0
-            self.update()
-
     def setIndeterminate(self, indeterminate):
         if self._indeterminate != indeterminate:
             self._indeterminate = indeterminate
@@ -476,28 +981,21 @@ class PartialProgressRing(CustomProgressRing):
     setDeterminate = setDetermined
 
     def _angleToQt(self, angle):
-        return ((450 - angle) % 360) * 16
+        return int(((450 - angle) % 360) * 16)
 
-    def paintEvent(self, e):
-        painter = QPainter(self)
-        painter.setRenderHints(QPainter.Antialiasing)
+    def _updatePaintCache(self):
+        super()._updatePaintCache()
+        self._paintStartAngle = self._angleToQt(self._startAngle)
+        self._spriteKey += (self._startAngle, self._maxAngle)
 
-        cw = self._strokeWidth
-        w = min(self.width(), self.height()) - cw
-        rc = QRectF(cw / 2, self.height() / 2 - w / 2, w, w)
+    def _drawRing(self, painter: QPainter):
+        rc = self._paintRect
 
         if self._drawBackground:
-            bc = self.darkBackgroundColor if isDarkTheme() else self.lightBackgroundColor
-            painter.setPen(QPen(bc, cw, Qt.SolidLine, Qt.RoundCap))
-            painter.drawArc(
-                rc,
-                self._angleToQt(self._startAngle),
-                -self._maxAngle * 16
-            )
+            painter.setPen(self._backgroundPen)
+            painter.drawArc(rc, self._paintStartAngle, -self._maxAngle * 16)
 
         if self._indeterminate:
-            painter.setPen(QPen(self.barColor(), cw, Qt.SolidLine, Qt.RoundCap))
-
             start_ratio = self._barStart
             span_ratio = self._barSpan
 
@@ -510,11 +1008,8 @@ class PartialProgressRing(CustomProgressRing):
             actual_start = self._startAngle + start_ratio * self._maxAngle
             actual_span = span_ratio * self._maxAngle
 
-            painter.drawArc(
-                rc,
-                self._angleToQt(actual_start),
-                -actual_span * 16
-            )
+            painter.setPen(self._barPen)
+            painter.drawArc(rc, self._angleToQt(actual_start), -int(actual_span * 16))
             return
 
         if self.maximum() <= self.minimum():
@@ -529,12 +1024,8 @@ class PartialProgressRing(CustomProgressRing):
             degree = 0
 
         if degree > 0:
-            painter.setPen(QPen(self.barColor(), cw, Qt.SolidLine, Qt.RoundCap))
-            painter.drawArc(
-                rc,
-                self._angleToQt(self._startAngle),
-                -degree * 16
-            )
+            painter.setPen(self._barPen)
+            painter.drawArc(rc, self._paintStartAngle, -degree * 16)
 
         if self.isTextVisible() and total > 0:
             actual_progress = self.value() - self.minimum()
@@ -542,7 +1033,7 @@ class PartialProgressRing(CustomProgressRing):
             self._drawText(painter, f"{progress_percent}%")
 
 
-class CustomProgressBar(QProgressBar):
+class CustomProgressBar(QProgressBar, _ClockAnimationBase):
     """横向进度条，支持确定/不确定模式。"""
 
     def __init__(self, parent=None, useAni=True, indeterminate=False,
@@ -574,9 +1065,12 @@ class CustomProgressBar(QProgressBar):
 
         self._shortPos = 0
         self._longPos = 0
-        self._indeterminateAnimationGroup = None
 
-        self._initAnimations()
+        self._paintCacheDirty = True
+        qconfig.themeChanged.connect(self._invalidatePaintCache)
+        qconfig.themeColorChanged.connect(self._invalidatePaintCache)
+
+        self._progressSink = ProgressSink(self.setVal, parent=self)
 
         self.setFixedHeight(height)
         self.valueChanged.connect(self._onValueChanged)
@@ -585,28 +1079,19 @@ class CustomProgressBar(QProgressBar):
         if indeterminate:
             self.startIndeterminateAnimation()
 
-    def _initAnimations(self):
-        self._valueAnimation.setDuration(150)
-
-        self.shortBarAni = QPropertyAnimation(self, b'shortPos', self)
-        self.longBarAni = QPropertyAnimation(self, b'longPos', self)
-
-        self.shortBarAni.setDuration(833)
-        self.longBarAni.setDuration(1167)
-        self.shortBarAni.setStartValue(0)
-        self.longBarAni.setStartValue(0)
-        self.shortBarAni.setEndValue(1.45)
-        self.longBarAni.setEndValue(1.75)
-        self.longBarAni.setEasingCurve(QEasingCurve.OutQuad)
-
-        self.longBarAniGroup = QSequentialAnimationGroup(self)
-        self.longBarAniGroup.addPause(785)
-        self.longBarAniGroup.addAnimation(self.longBarAni)
+    def _resetIndeterminatePhase(self):
+        self._shortPos = 0
+        self._longPos = 0
 
-        self._indeterminateAnimationGroup = QParallelAnimationGroup(self)
-        self._indeterminateAnimationGroup.addAnimation(self.shortBarAni)
-        self._indeterminateAnimationGroup.addAnimation(self.longBarAniGroup)
-        self._indeterminateAnimationGroup.setLoopCount(-1)
+    def _setIndeterminatePhase(self, elapsed: int):
+        """根据经过的时间计算长短两段滑块的位置，一个周期 1952 毫秒。"""
+        t = elapsed % 1952
+        self._shortPos = 1.45 * min(t / 833, 1.0)
+        if t < 785:
+            self._longPos = 0
+        else:
+            progress = (t - 785) / 1167
+            self._longPos = 1.75 * progress * (2 - progress)
 
     def getVal(self):
         return self._val
@@ -616,6 +1101,18 @@ class CustomProgressBar(QProgressBar):
         self.setValue(v)
         self.update()
 
+    def postVal(self, v: float):
+        """线程安全地提交进度值，高频调用会被合并，按帧率上限更新界面。"""
+        self._progressSink.post(v)
+
+    def setMaxFps(self, fps: int):
+        """设置 postVal 每秒最多更新界面的次数，0 表示不限制。"""
+        self._progressSink.setFps(fps)
+
+    def getMaxFps(self):
+        """返回 postVal 每秒最多更新界面的次数。"""
+        return self._progressSink.getFps()
+
     @Property(float)
     def val(self):
         return self._val
@@ -689,7 +1186,7 @@ class CustomProgressBar(QProgressBar):
     def setDrawBackground(self, draw: bool):
         if self._drawBackground != draw:
             self._drawBackground = draw
-            self.update()
+            self._invalidatePaintCache()
 
     def getHeight(self):
         return self._height
@@ -699,7 +1196,7 @@ class CustomProgressBar(QProgressBar):
             self._height = height
             self.setFixedHeight(height)
             self._radius = height / 2
-            self.update()
+            self._invalidatePaintCache()
 
     def getRadius(self):
         return self._radius
@@ -707,7 +1204,7 @@ class CustomProgressBar(QProgressBar):
     def setRadius(self, radius: int):
         if self._radius != radius:
             self._radius = radius
-            self.update()
+            self._invalidatePaintCache()
 
     def _onValueChanged(self, value):
         if not self._indeterminate and self._useAni:
@@ -725,22 +1222,6 @@ class CustomProgressBar(QProgressBar):
             if not self._indeterminate:
                 self.update()
 
-    def startIndeterminateAnimation(self):
-        """启动不确定模式动画。"""
-        if (self._indeterminateAnimationGroup and
-                not self._indeterminateAnimationGroup.state() == QParallelAnimationGroup.Running):
-            self._shortPos = 0
-            self._longPos = 0
-            self._indeterminateAnimationGroup.start()
-
-    def stopIndeterminateAnimation(self):
-        """停止不确定模式动画。"""
-        if self._indeterminateAnimationGroup:
-            self._indeterminateAnimationGroup.stop()
-            self._shortPos = 0
-            self._longPos = 0
-            self.update()
-
     def lightBarColor(self):
         return self._lightBarColor if self._lightBarColor.isValid() else themeColor()
 
@@ -750,33 +1231,32 @@ class CustomProgressBar(QProgressBar):
     def setCustomBarColor(self, light, dark):
         self._lightBarColor = QColor(light)
         self._darkBarColor = QColor(dark)
-        self.update()
+        self._invalidatePaintCache()
 
     def setCustomBackgroundColor(self, light, dark):
         self.lightBackgroundColor = QColor(light)
         self.darkBackgroundColor = QColor(dark)
-        self.update()
+        self._invalidatePaintCache()
 
     def resume(self):
         self._isPaused = False
         self._isError = False
-        self.update()
+        if self._indeterminate:
+            self._resumeIndeterminateAnimation()
+        self._invalidatePaintCache()
 
     def pause(self):
         self._isPaused = True
         if self._indeterminate:
-            self._indeterminateAnimationGroup.pause()
-        self.update()
+            self._pauseIndeterminateAnimation()
+        self._invalidatePaintCache()
 
     def setPaused(self, isPaused: bool):
         if self._isPaused != isPaused:
-            self._isPaused = isPaused
-            if self._indeterminate:
-                if isPaused:
-                    self._indeterminateAnimationGroup.pause()
-                else:
-                    self._indeterminateAnimationGroup.resume()
-            self.update()
+            if isPaused:
+                self.pause()
+            else:
+                self.resume()
 
     def isPaused(self):
         return self._isPaused
@@ -784,8 +1264,8 @@ class CustomProgressBar(QProgressBar):
     def error(self):
         self._isError = True
         if self._indeterminate:
-            self._indeterminateAnimationGroup.stop()
-        self.update()
+            self._pauseIndeterminateAnimation()
+        self._invalidatePaintCache()
 
     def setError(self, isError: bool):
         if self._isError != isError:
@@ -807,37 +1287,62 @@ class CustomProgressBar(QProgressBar):
 
         return self.darkBarColor() if isDarkTheme() else self.lightBarColor()
 
+    def _invalidatePaintCache(self, *args):
+        """标记几何尺寸和颜色需要重新计算。"""
+        self._paintCacheDirty = True
+        self.update()
+
+    def _updatePaintCache(self):
+        """预先计算背景线位置、滑块宽度和颜色，绘制时只进行矩形绘制。"""
+        width = self.width()
+        self._backgroundY = self.height() // 2
+        self._backgroundColor = self.darkBackgroundColor if isDarkTheme() else self.lightBackgroundColor
+        self._barBrush = QBrush(self.barColor())
+        self._shortWidth = int(0.4 * width)
+        self._longWidth = int(0.6 * width)
+        self._paintCacheDirty = False
+
+    def resizeEvent(self, e):
+        self._paintCacheDirty = True
+        super().resizeEvent(e)
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._updateClockRegistration()
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        self._updateClockRegistration()
+
     def paintEvent(self, e):
+        if self._paintCacheDirty:
+            self._updatePaintCache()
+
         painter = QPainter(self)
         painter.setRenderHints(QPainter.Antialiasing)
+        width = self.width()
+        height = self.height()
 
         if self._drawBackground:
-            bc = self.darkBackgroundColor if isDarkTheme() else self.lightBackgroundColor
-            painter.setPen(bc)
-            from math import floor
-            y = floor(self.height() / 2)
-            painter.drawLine(0, y, self.width(), y)
+            painter.setPen(self._backgroundColor)
+            painter.drawLine(0, self._backgroundY, width, self._backgroundY)
 
-        if self._indeterminate:
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(self.barColor())
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._barBrush)
 
-            x = int((self._shortPos - 0.4) * self.width())
-            w = int(0.4 * self.width())
-            painter.drawRoundedRect(x, 0, w, self.height(), self._radius, self._radius)
+        if self._indeterminate:
+            x = int(self._shortPos * width) - self._shortWidth
+            painter.drawRoundedRect(x, 0, self._shortWidth, height, self._radius, self._radius)
 
-            x = int((self._longPos - 0.6) * self.width())
-            w = int(0.6 * self.width())
-            painter.drawRoundedRect(x, 0, w, self.height(), self._radius, self._radius)
+            x = int(self._longPos * width) - self._longWidth
+            painter.drawRoundedRect(x, 0, self._longWidth, height, self._radius, self._radius)
 
         else:
             if self.minimum() >= self.maximum():
                 return
 
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(self.barColor())
-            w = int(self._val / (self.maximum() - self.minimum()) * self.width())
-            painter.drawRoundedRect(0, 0, w, self.height(), self._radius, self._radius)
+            w = int(self._val / (self.maximum() - self.minimum()) * width)
+            painter.drawRoundedRect(0, 0, w, height, self._radius, self._radius)
 
     def setValue(self, value: int):
         super().setValue(value)
@@ -848,4 +1353,3 @@ class CustomProgressBar(QProgressBar):
     drawBackground = Property(bool, getDrawBackground, setDrawBackground)
     heightProp = Property(int, getHeight, setHeight)
     radius = Property(float, getRadius, setRadius)
-    val = Property(float, getVal, setVal)
@@ -1,4 +1,9 @@
 from ..base import *
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+import asyncio
+import inspect
+import itertools
 
 
 class StatisticsWidget(QWidget):
@@ -101,11 +106,12 @@ class ComboBoxWithLabel(QWidget):
 
 class PageSpliter(QWidget):
     pageChanged = pyqtSignal(int, int, int)
+    pageChangeCommitted = pyqtSignal(int, int, int)
 
     def __init__(self, parent=None, max_page: int = 10, max_visible: int = 10, length: int = 10,
                  preset_length: list = None, max_length: int = 100, total_count: int = -1,
                  show_max: bool = True, show_jump_input: bool = True, show_length_input: bool = True,
-                 show_first_last: bool = True, show_total_count: bool = True):
+                 show_first_last: bool = True, show_total_count: bool = True, debounce: int = 0):
         """
         :param parent: 父组件
         :param max_page: 最大页码（当total_count>0时会被覆盖）
@@ -119,12 +125,20 @@ class PageSpliter(QWidget):
         :param show_length_input: 是否显示页面长度设置控件
         :param show_first_last: 是否显示首页/末页跳转按钮
         :param show_total_count: 是否显示共x项总数标签
+        :param debounce: pageChangeCommitted信号的防抖时间（毫秒），0表示立即发送
         """
         super().__init__(parent)
 
         self.page = 0
         self._buttons = {}
+        self._buttonPool = []
         self.numberButtons = []
+        self._dataSource = None
+
+        self._debounce = max(0, debounce)
+        self._commitTimer = QTimer(self)
+        self._commitTimer.setSingleShot(True)
+        self._commitTimer.timeout.connect(self._commit)
 
         if preset_length is None:
             preset_length = []
@@ -231,6 +245,8 @@ class PageSpliter(QWidget):
             self.lineEdit1.setValidator(QIntValidator(1, self.max_page))
             self.lineEdit2.setValidator(QIntValidator(1, self.max_length))
 
+        self.pageChangeCommitted.connect(self._requestData)
+
         self.lineEdit1.returnPressed.connect(lambda: self.setPage(int(self.lineEdit1.text())))
         self.lineEdit2.returnPressed.connect(lambda: self.setLength(int(self.lineEdit2.text())))
 
@@ -252,21 +268,17 @@ class PageSpliter(QWidget):
         if self.max_page > 0:
             display_count = min(self.max_visible, self.max_page)
 
-        current_count = len(self.numberButtons)
-
-        if current_count > display_count:
-            for i in range(current_count - 1, display_count - 1, -1):
-                btn = self.numberButtons.pop()
-                self.hBoxLayout.removeWidget(btn)
-                btn.deleteLater()
+        for i in range(len(self._buttonPool), display_count):
+            btn = TransparentToggleToolButton(self)
+            btn.clicked.connect(self._createButtonHandler(i))
+            self._buttonPool.append(btn)
+            index = self.hBoxLayout.indexOf(self.rightButton)
+            self.hBoxLayout.insertWidget(index, btn, 0, Qt.AlignLeft)
 
-        if current_count < display_count:
-            for i in range(current_count, display_count):
-                btn = TransparentToggleToolButton(self)
-                btn.clicked.connect(self._createButtonHandler(len(self.numberButtons)))
-                self.numberButtons.append(btn)
-                index = self.hBoxLayout.indexOf(self.rightButton)
-                self.hBoxLayout.insertWidget(index, btn, 0, Qt.AlignLeft)
+        if len(self.numberButtons) != display_count:
+            for btn in self._buttonPool[display_count:len(self.numberButtons)]:
+                btn.setVisible(False)
+            self.numberButtons = self._buttonPool[:display_count]
 
         self._updateButtons()
 
@@ -282,12 +294,15 @@ class PageSpliter(QWidget):
 
         for i, btn in enumerate(self.numberButtons):
             btn_num = start + i
-            if self.max_page <= 0 or btn_num <= self.max_page:
-                btn.setText(str(btn_num))
-                btn.setVisible(True)
-                btn.setChecked(btn_num == self.page)
-            else:
-                btn.setVisible(False)
+            visible = self.max_page <= 0 or btn_num <= self.max_page
+            if visible:
+                text = str(btn_num)
+                if btn.text() != text:
+                    btn.setText(text)
+                if btn.isChecked() != (btn_num == self.page):
+                    btn.setChecked(btn_num == self.page)
+            if btn.isHidden() == visible:
+                btn.setVisible(visible)
 
         self.leftButton.setEnabled(self.page > 1)
         self.rightButton.setEnabled(self.max_page <= 0 or self.page < self.max_page)
@@ -328,7 +343,6 @@ class PageSpliter(QWidget):
 
         self.max_visible = max_visible
         self._adjustButtonCount()
-        self._updateButtons()
 
     def getMaxVisible(self):
         """
@@ -339,7 +353,7 @@ class PageSpliter(QWidget):
     def setPage(self, page: int, signal: bool = True):
         """
         :param page: 新的页码（从1开始）
-        :param signal: 是否发送pageChanged信号
+        :param signal: 是否发送pageChanged和pageChangeCommitted信号
         """
         if self.page == page and not signal:
             return
@@ -358,7 +372,48 @@ class PageSpliter(QWidget):
         self.lineEdit1.setText(str(page))
 
         if signal:
-            self.pageChanged.emit(self.page, self.length, self.getNumber())
+            self._emitPageChanged()
+
+    def _emitPageChanged(self):
+        self.pageChanged.emit(self.page, self.length, self.getNumber())
+        if self._debounce > 0:
+            self._commitTimer.start(self._debounce)
+        else:
+            self._commit()
+
+    def _commit(self):
+        self._commitTimer.stop()
+        self.pageChangeCommitted.emit(self.page, self.length, self.getNumber())
+
+    def commitPage(self):
+        """
+        立即发送等待中的pageChangeCommitted信号，没有等待发送的信号时不做任何操作
+        :return: 是否发送
+        """
+        if not self._commitTimer.isActive():
+            return False
+        self._commit()
+        return True
+
+    def isCommitPending(self):
+        """
+        :return: 是否有等待发送的pageChangeCommitted信号
+        """
+        return self._commitTimer.isActive()
+
+    def setDebounce(self, debounce: int):
+        """
+        :param debounce: pageChangeCommitted信号的防抖时间（毫秒），连续翻页时只在停止操作后发送最后一页，0表示立即发送
+        """
+        self._debounce = max(0, debounce)
+        if self._debounce == 0 and self._commitTimer.isActive():
+            self.commitPage()
+
+    def getDebounce(self):
+        """
+        :return: pageChangeCommitted信号的防抖时间（毫秒）
+        """
+        return self._debounce
 
     def getPage(self):
         """
@@ -381,7 +436,7 @@ class PageSpliter(QWidget):
     def setLength(self, length: int, signal: bool = True):
         """
         :param length: 新的页面长度
-        :param signal: 是否发送pageChanged信号
+        :param signal: 是否发送pageChanged和pageChangeCommitted信号
         """
         if length <= 0 or length > self.max_length:
             return
@@ -404,12 +459,12 @@ class PageSpliter(QWidget):
         self.comboBox.setCurrentText(f"{length} / 页")
 
         if signal:
-            self.pageChanged.emit(self.page, self.length, self.getNumber())
+            self._emitPageChanged()
 
     def setMaxPage(self, max_page: int, signal: bool = True):
         """
         :param max_page: 新的最大页码
-        :param signal: 是否发送pageChanged信号
+        :param signal: 是否发送pageChanged和pageChangeCommitted信号
         """
         self.max_page = max_page
 
@@ -431,7 +486,7 @@ class PageSpliter(QWidget):
         else:
             self._updateButtons()
             if signal:
-                self.pageChanged.emit(self.page, self.length, self.getNumber())
+                self._emitPageChanged()
 
     def getMaxPage(self):
         """
@@ -610,6 +665,263 @@ class PageSpliter(QWidget):
         """
         return self.total_count
 
+    def _requestData(self, page: int, length: int, number: int):
+        if self._dataSource is not None:
+            self._dataSource.request(page, length, self.max_page)
+
+    def setDataSource(self, source, load: bool = True):
+        """
+        :param source: 分页数据源PageDataSource，为None时解除绑定
+        :param load: 是否立即加载当前页
+        """
+        if self._dataSource is not None and self._dataSource is not source:
+            self._dataSource.cancel()
+        self._dataSource = source
+        if source is not None and load:
+            source.request(self.page, self.length, self.max_page)
+
+    def getDataSource(self):
+        """
+        :return: 分页数据源
+        """
+        return self._dataSource
+
+    def dataSource(self):
+        """
+        :return: 分页数据源
+        """
+        return self.getDataSource()
+
+
+async def _awaitResult(result):
+    return await result
+
+
+class PageDataSource(QObject):
+    pageLoaded = pyqtSignal(int, int, object)
+    pageFailed = pyqtSignal(int, int, object)
+    loadingChanged = pyqtSignal(bool)
+    _finishedSignal = pyqtSignal(object, object, object, object)
+
+    def __init__(self, fetch, parent=None, cache_size: int = 16, prefetch: int = 1, max_workers: int = 2, loop: asyncio.AbstractEventLoop = None):
+        """
+        分页数据源，在后台线程中获取页面数据，缓存最近访问的页面并预取相邻页面，绑定到PageSpliter后翻页时自动加载
+        :param fetch: 获取数据的函数，参数为页码（从1开始）和页面长度，返回数据列表，可以是async函数
+        :param parent: 父对象
+        :param cache_size: 缓存的页面数量
+        :param prefetch: 预取当前页前后的页面数量，0表示不预取
+        :param max_workers: 后台线程数量
+        :param loop: 运行async函数的事件循环，正在运行时协程提交到该循环中执行；不填则每次在后台线程中新建事件循环，此时协程不能使用绑定到其他事件循环的资源（例如aiohttp会话）
+        """
+        super().__init__(parent)
+        self._fetch = fetch
+        self._loop = loop
+        self._cacheSize = max(1, cache_size)
+        self._prefetch = max(0, prefetch)
+        self._maxWorkers = max(1, max_workers)
+        self._executor = None
+        self._cache = OrderedDict()
+        self._pending = {}
+        self._generation = itertools.count()
+        self._current = None
+        self._last = None
+        self._maxPage = 0
+
+        self._group = None
+        self._factory = None
+        self._updater = None
+        self._key = None
+
+        self._finishedSignal.connect(self._onFinished)
+        self.destroyed.connect(lambda: self._executor and self._executor.shutdown(False, cancel_futures=True))
+
+    def _submit(self, key: tuple):
+        if key in self._pending or key in self._cache:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self._maxWorkers, "zbWidgetLib-PageDataSource")
+        generation = next(self._generation)
+        self._pending[key] = (generation, self._executor.submit(self._run, key, generation))
+
+    def _run(self, key: tuple, generation: int):
+        items, error = None, None
+        try:
+            result = self._fetch(*key)
+            if inspect.isawaitable(result):
+                loop = self._loop
+                if loop is not None and loop.is_running():
+                    result = asyncio.run_coroutine_threadsafe(_awaitResult(result), loop).result()
+                else:
+                    result = asyncio.run(_awaitResult(result))
+            items = list(result) if result is not None else []
+        except Exception as ex:
+            error = ex
+        try:
+            self._finishedSignal.emit(key, generation, items, error)
+        except RuntimeError:
+            pass
+
+    def _neighbors(self, key: tuple):
+        page, length = key
+        keys = []
+        for i in range(1, self._prefetch + 1):
+            for p in (page + i, page - i):
+                if p >= 1 and (self._maxPage <= 0 or p <= self._maxPage):
+                    keys.append((p, length))
+        return keys
+
+    def _deliver(self, key: tuple, items: list):
+        if self._current is not None:
+            self._current = None
+            self.loadingChanged.emit(False)
+        if self._group is not None:
+            self._group.setItems(items, self._factory, self._updater, self._key)
+        self.pageLoaded.emit(key[0], key[1], items)
+        for neighbor in self._neighbors(key):
+            self._submit(neighbor)
+
+    def _onFinished(self, key: tuple, generation: int, items, error):
+        # 被取消或被refresh替换的请求结果已过期，不缓存也不发送
+        pending = self._pending.get(key)
+        if pending is None or pending[0] != generation:
+            return
+        del self._pending[key]
+        if error is None:
+            self._cache[key] = items
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cacheSize:
+                self._cache.popitem(last=False)
+        if key != self._current:
+            return
+        if error is None:
+            self._deliver(key, items)
+        else:
+            self._current = None
+            self.loadingChanged.emit(False)
+            self.pageFailed.emit(key[0], key[1], error)
+
+    def request(self, page: int, length: int, max_page: int = 0):
+        """
+        请求页面数据，命中缓存时立即发送pageLoaded信号，否则在后台获取，快速翻页时过期的请求会被取消
+        :param page: 页码（从1开始）
+        :param length: 页面长度
+        :param max_page: 最大页码，用于限制预取范围，0表示无限制
+        """
+        key = (page, length)
+        self._last = key
+        self._maxPage = max_page
+        wanted = {key, *self._neighbors(key)}
+        for k, (_, future) in list(self._pending.items()):
+            if k not in wanted and future.cancel():
+                del self._pending[k]
+
+        loading = self._current is not None
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self._deliver(key, self._cache[key])
+            return
+        self._current = key
+        if not loading:
+            self.loadingChanged.emit(True)
+        self._submit(key)
+
+    def refresh(self):
+        """
+        丢弃缓存并重新加载当前页
+        """
+        self.cancel()
+        self.clearCache()
+        if self._last is not None:
+            self.request(*self._last, self._maxPage)
+
+    def cancel(self):
+        """
+        取消所有未完成的请求
+        """
+        for _, future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._current is not None:
+            self._current = None
+            self.loadingChanged.emit(False)
+
+    def isLoading(self):
+        """
+        :return: 当前页是否正在加载
+        """
+        return self._current is not None
+
+    def clearCache(self):
+        """
+        清空页面缓存，数据变化后调用
+        """
+        self._cache.clear()
+
+    def getCache(self, page: int, length: int):
+        """
+        :param page: 页码
+        :param length: 页面长度
+        :return: 缓存的页面数据，未缓存时为None
+        """
+        return self._cache.get((page, length))
+
+    def setCacheSize(self, cache_size: int):
+        """
+        :param cache_size: 缓存的页面数量
+        """
+        self._cacheSize = max(1, cache_size)
+        while len(self._cache) > self._cacheSize:
+            self._cache.popitem(last=False)
+
+    def getCacheSize(self):
+        """
+        :return: 缓存的页面数量
+        """
+        return self._cacheSize
+
+    def setPrefetch(self, prefetch: int):
+        """
+        :param prefetch: 预取当前页前后的页面数量，0表示不预取
+        """
+        self._prefetch = max(0, prefetch)
+
+    def getPrefetch(self):
+        """
+        :return: 预取当前页前后的页面数量
+        """
+        return self._prefetch
+
+    def setLoop(self, loop: asyncio.AbstractEventLoop):
+        """
+        :param loop: 运行async函数的事件循环，为None时每次在后台线程中新建事件循环
+        """
+        self._loop = loop
+
+    def getLoop(self):
+        """
+        :return: 运行async函数的事件循环
+        """
+        return self._loop
+
+    def setCardGroup(self, group, factory, updater=None, key=None):
+        """
+        绑定卡片组，页面加载后通过setItems增量更新卡片
+        :param group: CardGroup或FlowCardGroup，为None时解除绑定
+        :param factory: 创建卡片的函数，参数为数据，返回卡片组件
+        :param updater: 更新已有卡片的函数，参数为卡片组件和数据
+        :param key: 从数据获取卡片组件id的函数，为None时使用数据本身
+        """
+        self._group = group
+        self._factory = factory
+        self._updater = updater
+        self._key = key
+
+    def getCardGroup(self):
+        """
+        :return: 绑定的卡片组
+        """
+        return self._group
+
 
 class LineEditWithLabel(QWidget):
     @functools.singledispatchmethod
@@ -1,6 +1,7 @@
 from qframelesswindow.windows import WindowsWindowEffect
 
 from ..base import *
+from .page import LazyPage
 
 
 class WindowEffectBase:
@@ -107,12 +108,17 @@ class Window(FluentWindow, WindowEffectBase):
     def __init__(self):
         super().__init__()
 
-    def addPage(self, page, name: str, icon, pos: str):
+    def addPage(self, page, name: str, icon, pos: str, preload: bool = False):
         """
         添加导航栏页面简易版
-        :param page: 页面对象
+        :param page: 页面对象，或创建页面的函数（第一次切换到该页时才调用）
         :param pos: 位置top/scroll/bottom
+        :param preload: 使用函数创建时，是否在空闲时预先构建
         """
+        if not isinstance(page, QWidget):
+            page = LazyPage(page, self, name)
+            if preload:
+                page.preload()
         page.setObjectName(name)
         return self.addSubInterface(page, icon, name, eval(f"NavigationItemPosition.{pos.upper()}"))
 